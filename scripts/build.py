@@ -2,19 +2,88 @@
 """Main build script - builds all outputs."""
 
 import argparse
+import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 
 from .build_concordance import build_concordance
 from .build_display import build_display
+from .build_headings import build_headings
 from .build_helloao import build_helloao
 from .build_index_cc_by import build_index_cc_by
 from .build_index_cc_by_split import build_index_cc_by_split
 from .build_index_pd import build_index_pd
 from .build_text_only import build_text_only
 from .generate_metadata import main as generate_metadata
-from .utils import log
+from .utils import WORKERS_ENV, log, worker_count
 from .validate import main as validate_main
 
+# Build stages in run order: name -> (build function, stages it reads output from,
+# weight of its share of the worker budget). Display and the indexes do the most
+# work per book; the split index and concordance start no worker processes.
+STAGES: dict[str, tuple[Callable[[], object], tuple[str, ...], int]] = {
+    "display": (build_display, (), 4),
+    "headings": (build_headings, (), 1),
+    "index_pd": (build_index_pd, ("headings",), 2),
+    "index_cc_by": (build_index_cc_by, ("headings",), 3),
+    "index_cc_by_split": (build_index_cc_by_split, ("index_cc_by",), 0),
+    "helloao": (build_helloao, (), 1),
+    "text_only": (build_text_only, (), 1),
+    "concordance": (build_concordance, ("index_pd",), 0),
+}
+
+
+def _run_stage(name: str, workers: int) -> None:
+    """Run one build stage (in a worker process when building in parallel).
+
+    The stage's own process pools start at most ``workers`` worker processes.
+    """
+    os.environ[WORKERS_ENV] = str(workers)
+    build, _, _ = STAGES[name]
+    build()
+    log("")
+
+
+def run_stages(names: list[str], parallel: bool = True, workers: int | None = None) -> None:
+    """Run the selected build stages.
+
+    In parallel mode, each stage starts in its own process as soon as the
+    selected stages it depends on have finished; otherwise stages run in order.
+    ``workers`` (default: one per CPU) is the total number of worker processes
+    for the build. A stage's share is fixed when it starts, so it is split
+    between the stages running at that moment by their weights rather than
+    evenly, leaving the long per-book stages most of the workers.
+    """
+    workers = workers or worker_count()
+    if not parallel or len(names) < 2:
+        for name in names:
+            _run_stage(name, workers)
+        return
+
+    pending = list(names)
+    done: set[str] = set()
+    running: dict[Future[None], str] = {}
+
+    with ProcessPoolExecutor(max_workers=len(names)) as executor:
+        while pending or running:
+            ready = [
+                name
+                for name in pending
+                if all(dep in done or dep not in names for dep in STAGES[name][1])
+            ]
+            weights = sum(STAGES[name][2] for name in [*running.values(), *ready]) or 1
+            for name in ready:
+                share = max(1, workers * STAGES[name][2] // weights)
+                running[executor.submit(_run_stage, name, share)] = name
+                pending.remove(name)
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                future.result()
+                done.add(name)
+
 
 def main() -> int:
     """Main build entry point."""
@@ -32,6 +101,14 @@ def main() -> int:
     parser.add_argument(
         "--all", action="store_true", help="Build all outputs (default if no options specified)"
     )
+    parser.add_argument(
+        "--no-parallel", action="store_true", help="Run build stages one after another"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Total worker processes shared by the build stages (default: one per CPU)",
+    )
 
     args = parser.parse_args()
 
@@ -49,34 +126,14 @@ def main() -> int:
     log("=== BSB Data Build Pipeline ===")
     log("")
 
-    try:
-        if args.display or build_all:
-            build_display()
-            log("")
+    selected = [name for name in STAGES if build_all or getattr(args, name, False)]
 
-        if args.index_pd or build_all:
-            build_index_pd()
-            log("")
+    # Headings have no option of their own: build them for the stages that read them
+    if "headings" not in selected and any("headings" in STAGES[name][1] for name in selected):
+        selected.insert(0, "headings")
 
-        if args.index_cc_by or build_all:
-            build_index_cc_by()
-            log("")
-
-        if args.index_cc_by_split or build_all:
-            build_index_cc_by_split()
-            log("")
-
-        if args.helloao or build_all:
-            build_helloao()
-            log("")
-
-        if args.text_only or build_all:
-            build_text_only()
-            log("")
-
-        if args.concordance or build_all:
-            build_concordance()
-            log("")
+    try:
+        run_stages(selected, parallel=not args.no_parallel, workers=args.workers)
 
         # Always generate metadata when building all
         if build_all:
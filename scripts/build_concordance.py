@@ -1,21 +1,33 @@
 #!/usr/bin/env python3
 """Build concordance index - maps Strong's numbers to verse references."""
 
+import re
 import sys
 from collections import defaultdict
 
-from .types import BOOK_CODES, BuildStats
 from .utils import (
     CONCORDANCE_DIR,
     INDEX_PD_DIR,
     ensure_dir,
     format_file_size,
+    iter_jsonl,
     log,
-    read_jsonl,
     write_json,
     write_jsonl,
 )
 
+# Strong's number parts: prefix, number, optional letter suffix ("H1a")
+STRONGS_PARTS = re.compile(r"([HG])(\d+)([a-z]?)")
+
+
+def strongs_sort_key(s: str) -> tuple[int, int, int]:
+    """Sort key: Hebrew (H) before Greek (G), numerically, then by suffix."""
+    match = STRONGS_PARTS.fullmatch(s)
+    if not match:
+        return (2, 0, 0)
+    prefix, num, suffix = match.groups()
+    return (0 if prefix == "H" else 1, int(num), ord(suffix) if suffix else 0)
+
 
 def build_concordance() -> dict[str, list[str]]:
     """Build concordance index mapping Strong's numbers to verse IDs.
@@ -43,45 +55,37 @@ def build_concordance() -> dict[str, list[str]]:
     # Ensure output directory exists
     ensure_dir(CONCORDANCE_DIR)
 
-    # Load all verses from the PD index
-    log("Loading PD index...")
-    all_verses = read_jsonl(source_path)
-    log(f"  Loaded {len(all_verses)} verses")
-
-    # Build concordance: Strong's number -> list of verse IDs
-    log("Building concordance mapping...")
+    # Build concordance: Strong's number -> list of verse IDs, streaming the PD
+    # index. Verses are in canonical order, so each verse list is already sorted.
+    log("Building concordance mapping from PD index...")
     concordance: dict[str, list[str]] = defaultdict(list)
+    verse_count = 0
 
-    for verse in all_verses:
+    for verse in iter_jsonl(source_path):
         verse_id = verse["id"]
-        strongs_list = verse.get("s", [])
+        verse_count += 1
 
-        for strongs in strongs_list:
+        for strongs in verse.get("s", []):
             concordance[strongs].append(verse_id)
 
-    # Sort Strong's numbers for consistent output
-    # Hebrew (H) numbers first, then Greek (G), numerically within each
-    def sort_key(s: str) -> tuple[int, int]:
-        prefix = 0 if s.startswith("H") else 1
-        # Extract numeric part, handle suffixes like "H1a"
-        num_str = s[1:].rstrip("abcdefghij")
-        suffix = s[1:][len(num_str) :] if len(s[1:]) > len(num_str) else ""
-        num = int(num_str) if num_str else 0
-        suffix_val = ord(suffix) if suffix else 0
-        return (prefix, num, suffix_val)
+    log(f"  Loaded {verse_count} verses")
 
-    sorted_strongs = sorted(concordance.keys(), key=sort_key)
-    sorted_concordance = {s: concordance[s] for s in sorted_strongs}
+    # Order Strong's numbers (H before G, numerically) for consistent output
+    sorted_concordance = dict(
+        sorted(concordance.items(), key=lambda item: strongs_sort_key(item[0]))
+    )
 
     # Write output as single JSON file
     log("Writing concordance...")
     output_path = CONCORDANCE_DIR / "strongs-to-verses.json"
-    write_json(output_path, sorted_concordance)
+    output_size = write_json(output_path, sorted_concordance)
 
     # Also write a JSONL version for streaming access
     jsonl_path = CONCORDANCE_DIR / "strongs-to-verses.jsonl"
-    jsonl_data = [{"strongs": s, "verses": verses} for s, verses in sorted_concordance.items()]
-    write_jsonl(jsonl_path, jsonl_data)
+    write_jsonl(
+        jsonl_path,
+        ({"strongs": s, "verses": verses} for s, verses in sorted_concordance.items()),
+    )
 
     # Write stats
     total_strongs = len(sorted_concordance)
@@ -108,7 +112,6 @@ def build_concordance() -> dict[str, list[str]]:
     log(f"Total verse references: {total_refs}")
     log(f"Average verses per Strong's: {stats['avg_verses_per_strongs']}")
 
-    output_size = output_path.stat().st_size
     log(f"Output file: {output_path}")
     log(f"Output size: {format_file_size(output_size)}")
 
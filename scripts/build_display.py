@@ -6,20 +6,36 @@ HEB/GRK text comes from TSV source (word-level alignment).
 """
 
 import csv
+import hashlib
+import pickle
 import re
 import sys
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from .convert_usj import parse_usj_file
-from .types import BOOK_CODES, BuildStats
+from .types import BOOK_CODES, BOOK_NUMBERS, BuildStats
 from .utils import (
     BSB_TABLES_FILE,
+    CACHE_DIR,
     DISPLAY_DIR,
     USJ_DIR,
     ensure_dir,
+    file_digest,
     format_file_size,
+    load_pickle,
     log,
+    worker_count,
+    write_bytes_atomic,
+    write_bytes_if_changed,
     write_json,
 )
 
@@ -176,80 +192,137 @@ USJ_FILE_PREFIX = {
 }
 
 
+# TSV columns used: HebSort, GrkSort, Language, OrigText, StrongsHeb, StrongsGrk, VerseId
+TSV_COLUMNS = itemgetter(0, 1, 4, 5, 10, 11, 12)
+
+# Sort order for words whose HebSort/GrkSort is not a number (placed last in the verse)
+UNSORTED_WORD = sys.maxsize
+SORT_ORDER = itemgetter(0)
+
+# TSV VerseId: "<book name> <chapter>:<verse>" (book names may contain spaces)
+VERSE_ID_PATTERN = re.compile(r"(?P<book>.+) (?P<chapter>\d+):(?P<verse>\d+)\s*")
+
+# Rows with fewer columns are skipped
+TSV_MIN_COLUMNS = 19
+
+# Read buffer for the (large) BSB tables TSV
+READ_BUFFER_SIZE = 1 << 20
+
+# Threads per book worker for writing chapter files
+CHAPTER_WRITE_THREADS = 8
+
+# Per-book cache entries, keyed by source and code digests
+DISPLAY_CACHE_DIR = CACHE_DIR / "display"
+# Content-addressed chapter files ({book}-{digest}), copied into the output and
+# shared by a book's cache entries
+DISPLAY_BLOB_DIR = CACHE_DIR / "display-blobs"
+
+# A verse's English words as parsed from USJ: [(text, strongs), ...]
+VerseWords = list[tuple[str, str | None]]
+# A book's TSV slice: {(chapter, verse): {"orig": [(sort, [text, strongs]), ...], "lang": ...}}
+TsvBook = dict[tuple[int, int], dict[str, Any]]
+
+# Book build result: (stats, chapters, files_written, bytes_written)
+BookResult = tuple[BuildStats, int, int, int]
+# Cache entry: ({chapter file name: blob digest}, result)
+CacheEntry = tuple[dict[str, str], BookResult]
+
+# Modules whose changes alter display output
+_SCRIPTS_DIR = Path(__file__).parent
+DISPLAY_CODE_FILES = [
+    _SCRIPTS_DIR / name for name in ("build_display.py", "convert_usj.py", "types.py", "utils.py")
+]
+
+
 def parse_verse_id(verse_id: str) -> tuple[str, int, int] | None:
     """Parse VerseId like 'Genesis 1:1' to (book_code, chapter, verse)."""
-    if not verse_id or ":" not in verse_id:
+    match = VERSE_ID_PATTERN.fullmatch(verse_id)
+    if match is None:
         return None
 
-    parts = verse_id.rsplit(":", 1)
-    if len(parts) != 2:
+    book_code = BOOK_NAME_TO_CODE.get(match["book"])
+    if not book_code:
         return None
 
-    book_chapter, verse_str = parts
-    last_space = book_chapter.rfind(" ")
-    if last_space == -1:
-        return None
+    return (book_code, int(match["chapter"]), int(match["verse"]))
 
-    book_name = book_chapter[:last_space]
-    chapter_str = book_chapter[last_space + 1 :]
 
-    book_code = BOOK_NAME_TO_CODE.get(book_name)
-    if not book_code:
+@lru_cache(maxsize=None)
+def tsv_strongs(prefix: str, strongs_col: str) -> str | None:
+    """Build a clean Strong's number from a TSV column ("1254 a" -> "H1254").
+
+    Cached, so each distinct number is built once and shared by every word.
+    """
+    strongs_raw = strongs_col.strip()
+    if not strongs_raw or (prefix == "H" and strongs_raw == "-"):
         return None
 
-    try:
-        chapter = int(chapter_str)
-        verse = int(verse_str)
-        return (book_code, chapter, verse)
-    except ValueError:
+    strongs = f"{prefix}{strongs_raw}".split()[0].rstrip("-").rstrip()
+    if strongs in ("H", "G", "H-", "G-"):
         return None
+    return strongs
 
 
-def load_usj_data() -> dict:
-    """Load English text from USJ files.
+def usj_file_for_book(book_num: int) -> Path | None:
+    """Return the Strong's USJ source path for a book number."""
+    prefix = USJ_FILE_PREFIX.get(book_num)
+    if not prefix:
+        return None
+    return USJ_DIR / f"{prefix}BSB_full_strongs.usj"
 
-    Returns a nested dict: {book: {chapter: {verse: [[text, strongs], ...]}}}
-    """
-    log("Loading USJ data for English text...")
 
-    if not USJ_DIR.exists():
-        log(f"ERROR: USJ directory not found: {USJ_DIR}")
-        log("  Run: bash scripts/fetch-sources.sh")
-        sys.exit(1)
+def load_usj_book(usj_file: Path) -> dict[int, dict[int, VerseWords]]:
+    """Load English text for one book from its USJ file.
 
-    # Structure: {book: {chapter: {verse: [[text, strongs], ...]}}}
-    data: dict = defaultdict(lambda: defaultdict(dict))
+    Returns a nested dict: {chapter: {verse: [(text, strongs), ...]}}
+    The word pairs are used as parsed; orjson encodes tuples as JSON arrays.
+    """
+    data: defaultdict[int, dict[int, VerseWords]] = defaultdict(dict)
 
-    for book_num, book_code in BOOK_CODES.items():
-        prefix = USJ_FILE_PREFIX.get(book_num)
-        if not prefix:
-            continue
+    for verse in parse_usj_file(usj_file):
+        data[verse["c"]][verse["v"]] = verse["w"]
 
-        usj_file = USJ_DIR / f"{prefix}BSB_full_strongs.usj"
-        if not usj_file.exists():
-            log(f"  WARNING: USJ file not found: {usj_file}")
-            continue
+    return data
 
-        verses = parse_usj_file(usj_file)
 
-        for verse in verses:
-            book = verse["b"]
-            chapter = verse["c"]
-            verse_num = verse["v"]
-            words = verse["w"]
+def _iter_tsv_rows() -> Iterator[tuple[str, ...]]:
+    """Yield the used columns (see TSV_COLUMNS) of each data row in the TSV.
 
-            # Convert word tuples to list format [[text, strongs], ...]
-            word_list = [[text, strongs] for text, strongs in words]
-            data[book][chapter][verse_num] = word_list
+    Rows are split on tabs directly, which is faster than csv.reader. Quoted
+    fields need the csv module's parsing rules, so from the first line with a
+    quote character on, the rest of the file goes through csv.reader.
+    """
+    with open(BSB_TABLES_FILE, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        next(f, None)  # Skip header
+        for line in f:
+            if '"' in line:
+                for row in csv.reader(chain([line], f), delimiter="\t"):
+                    if len(row) >= TSV_MIN_COLUMNS:
+                        yield TSV_COLUMNS(row)
+                return
+
+            row = line.rstrip("\n").split("\t")
+            if len(row) >= TSV_MIN_COLUMNS:
+                yield TSV_COLUMNS(row)
+
+
+def _check_tsv_book_contiguous(book_code: str, books_loaded: set[str]) -> None:
+    """Exit if a book's TSV rows resume after another book's (its slice was already sent)."""
+    if book_code in books_loaded:
+        log(f"ERROR: TSV rows for {book_code} are not contiguous.")
+        log(f"  Check the row order of {BSB_TABLES_FILE}")
+        sys.exit(1)
 
-    log(f"  Loaded USJ data for {len(data)} books")
-    return data
 
+def iter_tsv_books() -> Iterator[tuple[str, TsvBook]]:
+    """Stream Hebrew/Greek text from the TSV file one book at a time.
 
-def load_tsv_original_language_data() -> dict:
-    """Load Hebrew/Greek text from TSV file.
+    Rows are grouped by book in the TSV, so each book's slice is yielded as
+    soon as the next book starts instead of holding the whole table in memory.
+    A book whose rows resume after another book's is a fatal error, since its
+    first slice is already being built.
 
-    Returns a nested dict: {book: {chapter: {verse: {"orig": [[text, strongs], ...], "lang": "heb"|"grk"}}}}
+    Yields (book, {(chapter, verse): {"orig": [(sort, [text, strongs]), ...], "lang": ...}})
     """
     log("Loading TSV data for Hebrew/Greek text...")
 
@@ -258,175 +331,348 @@ def load_tsv_original_language_data() -> dict:
         log("  Run: bash scripts/fetch-sources.sh")
         sys.exit(1)
 
-    # Track current verse context for rows without VerseId
-    current_book = None
+    # Bound once as locals: these run for every row / Hebrew-Greek word
+    strip_directional = DIRECTIONAL_CHARS.sub
+    parse_verse = parse_verse_id
+    strongs_for = tsv_strongs
+    unsorted_word = UNSORTED_WORD
+
+    # Track current verse context for rows without VerseId ("" until the first book)
+    current_book = ""
     current_chapter = None
     current_verse = None
 
-    # Structure: {book: {chapter: {verse: {"orig": {sort: [text, strongs]}, "lang": "heb"|"grk"}}}}
-    data: dict = defaultdict(
-        lambda: defaultdict(lambda: defaultdict(lambda: {"orig": {}, "lang": "heb"}))
-    )
+    # Structure: {(chapter, verse): {"orig": [(sort, [text, strongs]), ...], "lang": "heb"|"grk"}}
+    # Words are appended in file order and sorted once per verse when the chapter is built
+    # Flat, plain dict so book slices are cheap to build and send to worker processes
+    book_data: TsvBook = {}
+    books_loaded: set[str] = set()
+
+    for (
+        heb_sort,
+        grk_sort,
+        language,
+        orig_text,  # Hebrew or Greek text
+        strongs_heb,
+        strongs_grk,
+        verse_id_col,
+    ) in _iter_tsv_rows():
+        # Parse verse reference if present
+        if verse_id_col and ":" in verse_id_col:
+            parsed = parse_verse(verse_id_col)
+            if parsed:
+                if parsed[0] != current_book and book_data:
+                    _check_tsv_book_contiguous(current_book, books_loaded)
+                    books_loaded.add(current_book)
+                    yield current_book, book_data
+                    book_data = {}
+                current_book, current_chapter, current_verse = parsed
+
+        # Skip non-Hebrew/Greek rows (after the verse context update, which
+        # every row takes part in, but before any per-word string work)
+        if language != "Hebrew" and language != "Greek":
+            continue
 
-    with open(BSB_TABLES_FILE, encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter="\t")
-        next(reader)  # Skip header
+        # Skip if we don't have a current verse context
+        if not current_book or not current_chapter or not current_verse:
+            continue
 
-        for row in reader:
-            if len(row) < 19:
-                continue
+        # Skip empty original text
+        orig_text = orig_text.strip()
+        if not orig_text:
+            continue
 
-            heb_sort = row[0]
-            grk_sort = row[1]
-            language = row[4]
-            orig_text = row[5]  # Hebrew or Greek text
-            strongs_heb = row[10] if len(row) > 10 else ""
-            strongs_grk = row[11] if len(row) > 11 else ""
-            verse_id_col = row[12] if len(row) > 12 else ""
-
-            # Parse verse reference if present
-            if verse_id_col and ":" in verse_id_col:
-                parsed = parse_verse_id(verse_id_col)
-                if parsed:
-                    current_book, current_chapter, current_verse = parsed
-
-            # Skip if we don't have a current verse context
-            if not current_book or not current_chapter or not current_verse:
-                continue
+        # Determine Strong's number and sort order
+        if language == "Hebrew":
+            strongs = strongs_for("H", strongs_heb)
+            orig_sort = int(heb_sort) if heb_sort.isdigit() else unsorted_word
+        else:  # Greek
+            strongs = strongs_for("G", strongs_grk)
+            orig_sort = int(grk_sort) if grk_sort.isdigit() else unsorted_word
 
-            # Skip non-Hebrew/Greek rows
-            if language not in ("Hebrew", "Greek"):
-                continue
+        verse_key = (current_chapter, current_verse)
+        verse_data = book_data.get(verse_key)
+        if verse_data is None:
+            verse_data = book_data[verse_key] = {"orig": [], "lang": "heb"}
+        verse_data["lang"] = "heb" if language == "Hebrew" else "grk"
 
-            # Skip empty original text
-            if not orig_text.strip():
-                continue
+        # Store original text (Hebrew/Greek) with sort order
+        cleaned_orig = strip_directional("", orig_text)
+        verse_data["orig"].append((orig_sort, [cleaned_orig, strongs]))
 
-            # Determine Strong's number and sort order
-            if language == "Hebrew":
-                strongs_raw = strongs_heb.strip()
-                strongs = f"H{strongs_raw}" if strongs_raw and strongs_raw != "-" else None
-                orig_sort = int(heb_sort) if heb_sort.isdigit() else 999999
-            else:  # Greek
-                strongs_raw = strongs_grk.strip()
-                strongs = f"G{strongs_raw}" if strongs_raw else None
-                orig_sort = int(grk_sort) if grk_sort.isdigit() else 999999
-
-            # Clean up strongs
-            if strongs:
-                strongs = strongs.split()[0].rstrip("-").rstrip()
-                if strongs in ("H", "G", "H-", "G-"):
-                    strongs = None
-
-            verse_data = data[current_book][current_chapter][current_verse]
-            verse_data["lang"] = "heb" if language == "Hebrew" else "grk"
-
-            # Store original text (Hebrew/Greek) with sort order
-            cleaned_orig = clean_text(orig_text.strip())
-            verse_data["orig"][orig_sort] = [cleaned_orig, strongs]
-
-    log(f"  Loaded TSV data for {len(data)} books")
-    return data
+    if book_data:
+        _check_tsv_book_contiguous(current_book, books_loaded)
+        books_loaded.add(current_book)
+        yield current_book, book_data
+
+    log(f"  Loaded TSV data for {len(books_loaded)} books")
+
+
+def _cache_code_digest() -> str:
+    """Digest of the modules that shape display output (invalidates the cache on change)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module_path in DISPLAY_CODE_FILES:
+        digest.update(file_digest(module_path).encode())
+    return digest.hexdigest()
+
+
+def _book_cache_entry(book_code: str, usj_file: Path, tsv_digest: str, code_digest: str) -> Path:
+    """Return the cache entry for a book given its source and code digests."""
+    key = hashlib.blake2b(
+        f"{code_digest}:{tsv_digest}:{file_digest(usj_file)}".encode(), digest_size=16
+    ).hexdigest()
+    return DISPLAY_CACHE_DIR / f"{book_code}-{key}.pickle"
+
+
+def _blob_path(book_code: str, digest: str) -> Path:
+    """Return the blob store path of a book's chapter with this content digest."""
+    return DISPLAY_BLOB_DIR / f"{book_code}-{digest}"
+
+
+def _load_cache_entry(cache_entry: Path) -> CacheEntry | None:
+    """Load a book's cache entry, or None if it is missing, unreadable or corrupt,
+    or any of its chapter blobs is missing."""
+    entry: CacheEntry | None = load_pickle(cache_entry)
+    if entry is None:
+        return None
+    manifest, _ = entry
+    book_code = cache_entry.name.split("-", 1)[0]
+    if not all(_blob_path(book_code, digest).exists() for digest in manifest.values()):
+        return None
+    return entry
+
+
+def _store_cache(cache_entry: Path, entry: CacheEntry) -> None:
+    """Save a book's chapter manifest and build result, dropping its stale entries
+    and the blobs only they referenced."""
+    manifest, _ = entry
+    live = set(manifest.values())
+    book_code = cache_entry.name.split("-", 1)[0]
+    for stale in DISPLAY_CACHE_DIR.glob(f"{book_code}-*.pickle"):
+        if stale == cache_entry:
+            continue
+        stale_entry: CacheEntry | None = load_pickle(stale)
+        stale_manifest = stale_entry[0] if stale_entry is not None else {}
+        stale.unlink(missing_ok=True)
+        for digest in set(stale_manifest.values()) - live:
+            _blob_path(book_code, digest).unlink(missing_ok=True)
+    write_bytes_atomic(cache_entry, pickle.dumps(entry))
+
+
+def _restore_book(book_code: str, entry: CacheEntry) -> BookResult:
+    """Copy a book's cached chapter files into the output directory.
+
+    Blobs are copied rather than linked, so editing a published file can
+    never alter the cache. Output files that already match are left alone.
+    """
+    manifest, result = entry
+    book_dir = DISPLAY_DIR / book_code
+    ensure_dir(book_dir)
+    for name, digest in manifest.items():
+        write_bytes_if_changed(book_dir / name, _blob_path(book_code, digest).read_bytes())
+    return result
+
+
+def _write_chapter(chapter_file: tuple[Path, bytes]) -> str:
+    """Write one (path, encoded chapter JSON) pair and store it in the blob store.
+
+    The blob is written once per content digest; the output file is only
+    rewritten if its contents changed. Returns the digest.
+    """
+    path, chapter_json = chapter_file
+    digest = hashlib.blake2b(chapter_json, digest_size=16).hexdigest()
+    blob = _blob_path(path.parent.name, digest)
+    if not blob.exists():
+        write_bytes_atomic(blob, chapter_json)
+    write_bytes_if_changed(path, chapter_json)
+    return digest
+
+
+def _process_book(
+    book_num: int, book_code: str, tsv_book_data: TsvBook, cache_entry: Path | None = None
+) -> BookResult:
+    """Build and write the display chapter files for one book.
+
+    Runs in a worker process. Returns (stats, chapters, files_written, bytes_written).
+    If cache_entry is given, the chapter manifest and result are saved there.
+    """
+    usj_file = usj_file_for_book(book_num)
+    assert usj_file is not None
+    usj_book_data = load_usj_book(usj_file)
+
+    stats = BuildStats(books_processed=1)
+    chapter_files: list[tuple[Path, bytes]] = []
+
+    # Create book directory
+    book_dir = DISPLAY_DIR / book_code
+    ensure_dir(book_dir)
+
+    # Get all chapters from USJ (primary source for chapters)
+    chapters = sorted(usj_book_data.keys())
+
+    # Language of each chapter in TSV data (from its first verse)
+    tsv_chapter_lang: dict[int, str] = {}
+    for (chapter, _), first_verse_data in tsv_book_data.items():
+        if chapter not in tsv_chapter_lang:
+            tsv_chapter_lang[chapter] = first_verse_data["lang"]
+
+    for chapter in chapters:
+        usj_chapter_data = usj_book_data[chapter]
+
+        # Chapter output sections: {verse: [[text, strongs], ...]}
+        eng_output: dict[int, VerseWords] = {}
+        orig_output: dict[int, list[list[str | None]]] = {}
+
+        # Determine language from TSV data (heb or grk)
+        lang_key = "heb"  # Default for OT
+        if book_num >= 40:  # NT books
+            lang_key = "grk"
+
+        # Check TSV data for actual language
+        lang_key = tsv_chapter_lang.get(chapter, lang_key)
+
+        for verse in sorted(usj_chapter_data.keys()):
+            eng_words = usj_chapter_data[verse]
+
+            if eng_words:
+                eng_output[verse] = eng_words
+                stats.total_verses += 1
+                stats.total_words += len(eng_words)
+                for text, strongs in eng_words:
+                    if strongs:
+                        stats.words_with_strongs += 1
+                        stats.unique_strongs.add(strongs)
+
+            # Get original language words from TSV
+            tsv_verse_data = tsv_book_data.get((chapter, verse))
+            if tsv_verse_data and "orig" in tsv_verse_data:
+                # Stable in-place sort: words sharing a sort order keep their file order
+                orig_sorted = tsv_verse_data["orig"]
+                orig_sorted.sort(key=SORT_ORDER)
+                orig_words = [word for _, word in orig_sorted]
+                if orig_words:
+                    orig_output[verse] = orig_words
+
+        if eng_output:
+            # Encode the fixed-shape chapter {"eng": {...}, "heb"|"grk": {...}} in one
+            # call; int verse keys are written as JSON strings
+            chapter_json = orjson.dumps(
+                {"eng": eng_output, lang_key: orig_output}, option=orjson.OPT_NON_STR_KEYS
+            )
+            chapter_files.append((book_dir / f"{book_code}{chapter}.json", chapter_json))
+
+    # Write chapter files; writes are I/O bound, so overlap them
+    with ThreadPoolExecutor(max_workers=CHAPTER_WRITE_THREADS) as pool:
+        digests = list(pool.map(_write_chapter, chapter_files))
+
+    bytes_written = sum(len(chapter_json) for _, chapter_json in chapter_files)
+    result = (stats, len(chapters), len(chapter_files), bytes_written)
+    if cache_entry is not None:
+        manifest = {path.name: digest for (path, _), digest in zip(chapter_files, digests)}
+        _store_cache(cache_entry, (manifest, result))
+    return result
 
 
 def build_display() -> BuildStats:
-    """Build display output files."""
+    """Build display output files.
+
+    Books are independent, so each one is parsed and written in a worker
+    process; results are collected in book order. Books whose USJ file, the
+    TSV and the build code are unchanged since the last run are restored
+    from the local cache instead.
+    """
     log("Building display output...")
 
-    # Load ENG data from USJ
-    usj_data = load_usj_data()
+    if not USJ_DIR.exists():
+        log(f"ERROR: USJ directory not found: {USJ_DIR}")
+        log("  Run: bash scripts/fetch-sources.sh")
+        sys.exit(1)
 
-    # Load HEB/GRK data from TSV
-    tsv_data = load_tsv_original_language_data()
+    # Find books with ENG data in USJ
+    usj_books: dict[int, str] = {}
+    for book_num, book_code in BOOK_CODES.items():
+        usj_file = usj_file_for_book(book_num)
+        if usj_file is None:
+            continue
+        if not usj_file.exists():
+            log(f"  WARNING: USJ file not found: {usj_file}")
+            continue
+        usj_books[book_num] = book_code
 
-    if not usj_data:
+    if not usj_books:
         log("ERROR: No data loaded from USJ")
         sys.exit(1)
 
-    # Ensure output directory exists
+    if not BSB_TABLES_FILE.exists():
+        log(f"ERROR: BSB tables file not found: {BSB_TABLES_FILE}")
+        log("  Run: bash scripts/fetch-sources.sh")
+        sys.exit(1)
+
+    # Look up cached output per book (keyed by source and code digests)
+    tsv_digest = file_digest(BSB_TABLES_FILE)
+    code_digest = _cache_code_digest()
+    cache_entries: dict[int, Path] = {}
+    cached_books: dict[int, CacheEntry] = {}
+    for book_num, book_code in usj_books.items():
+        usj_file = usj_file_for_book(book_num)
+        assert usj_file is not None
+        cache_entry = _book_cache_entry(book_code, usj_file, tsv_digest, code_digest)
+        cache_entries[book_num] = cache_entry
+        entry = _load_cache_entry(cache_entry)
+        if entry is not None:
+            cached_books[book_num] = entry
+    log(f"  Cached books: {len(cached_books)}/{len(usj_books)}")
+
+    # Ensure output and cache directories exist
     ensure_dir(DISPLAY_DIR)
+    ensure_dir(DISPLAY_CACHE_DIR)
+    ensure_dir(DISPLAY_BLOB_DIR)
 
     stats = BuildStats()
     total_books = len(BOOK_CODES)
     files_written = 0
+    total_size = 0
+
+    with ProcessPoolExecutor(max_workers=worker_count()) as executor:
+        futures = {
+            book_num: executor.submit(_restore_book, usj_books[book_num], entry)
+            for book_num, entry in cached_books.items()
+        }
+
+        if len(cached_books) < len(usj_books):
+            # Stream HEB/GRK data from TSV, dispatching each book as its slice is read
+            for book_code, tsv_book_data in iter_tsv_books():
+                book_num = BOOK_NUMBERS[book_code]
+                if book_num in usj_books and book_num not in futures:
+                    futures[book_num] = executor.submit(
+                        _process_book, book_num, book_code, tsv_book_data, cache_entries[book_num]
+                    )
+
+            # Books without any TSV rows still get their ENG text
+            for book_num, book_code in usj_books.items():
+                if book_num not in futures:
+                    futures[book_num] = executor.submit(
+                        _process_book, book_num, book_code, {}, cache_entries[book_num]
+                    )
+
+        for book_num, book_code in BOOK_CODES.items():
+            log(f"Processing {book_code} ({book_num}/{total_books})")
+
+            if book_num not in futures:
+                log(f"  WARNING: No USJ data for {book_code}")
+                continue
 
-    for book_num, book_code in BOOK_CODES.items():
-        log(f"Processing {book_code} ({book_num}/{total_books})")
-
-        if book_code not in usj_data:
-            log(f"  WARNING: No USJ data for {book_code}")
-            continue
-
-        usj_book_data = usj_data[book_code]
-        tsv_book_data = tsv_data.get(book_code, {})
-        stats.books_processed += 1
-
-        # Create book directory
-        book_dir = DISPLAY_DIR / book_code
-        ensure_dir(book_dir)
-
-        # Get all chapters from USJ (primary source for chapters)
-        chapters = sorted(usj_book_data.keys())
-
-        for chapter in chapters:
-            usj_chapter_data = usj_book_data[chapter]
-            tsv_chapter_data = tsv_book_data.get(chapter, {})
-
-            # Build chapter output structure
-            eng_output = {}
-            orig_output = {}
-
-            # Determine language from TSV data (heb or grk)
-            lang_key = "heb"  # Default for OT
-            if book_num >= 40:  # NT books
-                lang_key = "grk"
-
-            # Check TSV data for actual language
-            for verse in tsv_chapter_data:
-                if tsv_chapter_data[verse].get("lang"):
-                    lang_key = tsv_chapter_data[verse]["lang"]
-                    break
-
-            for verse in sorted(usj_chapter_data.keys()):
-                eng_words = usj_chapter_data[verse]
-
-                if eng_words:
-                    eng_output[str(verse)] = eng_words
-                    stats.total_verses += 1
-                    stats.total_words += len(eng_words)
-                    for text, strongs in eng_words:
-                        if strongs:
-                            stats.words_with_strongs += 1
-                            stats.unique_strongs.add(strongs)
-
-                # Get original language words from TSV
-                tsv_verse_data = tsv_chapter_data.get(verse, {})
-                if tsv_verse_data and "orig" in tsv_verse_data:
-                    orig_words = []
-                    for sort_key in sorted(tsv_verse_data["orig"].keys()):
-                        orig_words.append(tsv_verse_data["orig"][sort_key])
-                    if orig_words:
-                        orig_output[str(verse)] = orig_words
-
-            if eng_output:
-                # Build final chapter JSON
-                chapter_output = {
-                    "eng": eng_output,
-                    lang_key: orig_output,
-                }
-
-                # Write chapter file as compact JSON
-                output_path = book_dir / f"{book_code}{chapter}.json"
-                write_json(output_path, chapter_output, compact=True)
-                files_written += 1
-
-        log(f"  Wrote {len(chapters)} chapters")
+            book_stats, chapters, book_files, book_size = futures[book_num].result()
+            stats += book_stats
+            files_written += book_files
+            total_size += book_size
+            log(f"  Wrote {chapters} chapters")
 
     # Write stats
     stats_dict = stats.to_dict()
     stats_dict["files_written"] = files_written
     stats_path = DISPLAY_DIR / "stats.json"
-    write_json(stats_path, stats_dict)
+    total_size += write_json(stats_path, stats_dict)
 
     # Log summary
     log("")
@@ -438,8 +684,6 @@ def build_display() -> BuildStats:
     log(f"Unique Strong's numbers: {len(stats.unique_strongs)}")
     log(f"Chapter files written: {files_written}")
 
-    # Calculate total output size
-    total_size = sum(f.stat().st_size for f in DISPLAY_DIR.rglob("*.json"))
     log(f"Total output size: {format_file_size(total_size)}")
 
     return stats
@@ -5,18 +5,23 @@ Output: headings.jsonl with bidirectional links to verses
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, TypedDict
 
-from .types import BOOK_CODES, USJ_FILES
+from .convert_usj import usj_file_path
+from .types import BOOK_CODES
 from .utils import (
     BASE_DIR,
-    USJ_DIR,
     check_sources_exist,
     ensure_dir,
+    iter_jsonl,
     log,
     log_book_progress,
     read_json,
+    worker_count,
     write_json,
     write_jsonl,
 )
@@ -35,6 +40,8 @@ class Heading(TypedDict):
 # Heading markers to extract
 HEADING_MARKERS = {"s1", "s2", "s3", "s4", "s5", "ms1", "ms2", "r", "d", "sr", "mr"}
 
+HEADINGS_FILE = BASE_DIR / "headings.jsonl"
+
 
 def extract_text_from_content(content: list[Any]) -> str:
     """Extract plain text from USJ content array."""
@@ -51,18 +58,25 @@ def extract_text_from_content(content: list[Any]) -> str:
     return text.strip()
 
 
-def extract_refs_from_content(content: list[Any]) -> list[str]:
-    """Extract reference locations from content (for 'r' markers)."""
+def extract_text_and_refs(content: list[Any]) -> tuple[str, list[str]]:
+    """Extract plain text and reference locations in one pass (for 'r' markers)."""
+    text = ""
     refs = []
     for item in content:
-        if isinstance(item, dict):
+        if isinstance(item, str):
+            text += item
+        elif isinstance(item, dict):
             if item.get("type") == "ref":
                 loc = item.get("loc", "")
                 if loc:
                     refs.append(loc)
+                # Include reference text
+                text += extract_text_from_content(item.get("content", []))
             elif "content" in item:
-                refs.extend(extract_refs_from_content(item["content"]))
-    return refs
+                inner_text, inner_refs = extract_text_and_refs(item["content"])
+                text += inner_text
+                refs.extend(inner_refs)
+    return text.strip(), refs
 
 
 def parse_headings_from_usj(usj: dict[str, Any], book_code: str) -> list[Heading]:
@@ -116,8 +130,10 @@ def parse_headings_from_usj(usj: dict[str, Any], book_code: str) -> list[Heading
             elif item_type == "para" and marker in HEADING_MARKERS:
                 # This is a heading paragraph
                 content_list = item.get("content", [])
-                text = extract_text_from_content(content_list)
-                refs = extract_refs_from_content(content_list) if marker == "r" else []
+                if marker == "r":
+                    text, refs = extract_text_and_refs(content_list)
+                else:
+                    text, refs = extract_text_from_content(content_list), []
 
                 if text:  # Only add non-empty headings
                     pending_headings.append(
@@ -144,9 +160,38 @@ def parse_headings_from_usj(usj: dict[str, Any], book_code: str) -> list[Heading
     return headings
 
 
+def _book_headings(book_code: str, usj_path: Path) -> list[Heading]:
+    """Parse one book's headings (runs in a worker process)."""
+    usj = read_json(usj_path)
+    return parse_headings_from_usj(usj, book_code)
+
+
+def map_verse_headings(headings: list[Heading]) -> dict[str, list[str]]:
+    """Map verse IDs to the IDs of the headings placed before them.
+
+    The stable sort groups each verse's headings while keeping them in document order.
+    """
+    verse_key = itemgetter("b", "c", "before_v")
+    return {
+        f"{b}.{c}.{v}": [h["id"] for h in group]
+        for (b, c, v), group in groupby(sorted(headings, key=verse_key), key=verse_key)
+    }
+
+
+def load_verse_headings() -> dict[str, list[str]]:
+    """Load the verse-to-heading mapping from a previously built headings index."""
+    if not HEADINGS_FILE.exists():
+        log("ERROR: Headings index not found. Run build_headings first.")
+        log(f"  Expected: {HEADINGS_FILE}")
+        sys.exit(1)
+    return map_verse_headings(list(iter_jsonl(HEADINGS_FILE)))
+
+
 def build_headings() -> dict[str, list[str]]:
     """Build headings index and return verse-to-heading mapping.
 
+    Books are parsed in worker processes; headings are collected in book order.
+
     Returns: dict mapping verse IDs to list of heading IDs
     """
     log("Building headings index...")
@@ -165,36 +210,29 @@ def build_headings() -> dict[str, list[str]]:
     all_headings: list[Heading] = []
     total_books = len(BOOK_CODES)
 
-    for book_num, book_code in BOOK_CODES.items():
-        log_book_progress(book_num, total_books, book_code)
+    with ProcessPoolExecutor(max_workers=worker_count()) as executor:
+        futures = {}
+        for book_code in BOOK_CODES.values():
+            usj_path = usj_file_path(book_code)
+            if usj_path is not None and usj_path.exists():
+                futures[book_code] = executor.submit(_book_headings, book_code, usj_path)
 
-        # Get USJ file path
-        usj_filename = USJ_FILES.get(book_code)
-        if not usj_filename:
-            continue
+        for book_num, book_code in BOOK_CODES.items():
+            log_book_progress(book_num, total_books, book_code)
 
-        usj_path = USJ_DIR / usj_filename
-        if not usj_path.exists():
-            continue
+            # Books without a USJ file have no headings
+            if book_code not in futures:
+                continue
 
-        # Parse USJ
-        usj = read_json(usj_path)
-        headings = parse_headings_from_usj(usj, book_code)
-        all_headings.extend(headings)
+            headings = futures[book_code].result()
+            all_headings.extend(headings)
 
-        log(f"  Found {len(headings)} headings")
+            log(f"  Found {len(headings)} headings")
 
-    # Build verse-to-heading mapping for cross-referencing
-    verse_to_headings: dict[str, list[str]] = {}
-    for h in all_headings:
-        verse_id = f"{h['b']}.{h['c']}.{h['before_v']}"
-        if verse_id not in verse_to_headings:
-            verse_to_headings[verse_id] = []
-        verse_to_headings[verse_id].append(h["id"])
+    verse_to_headings = map_verse_headings(all_headings)
 
     # Write headings index
-    output_path = BASE_DIR / "headings.jsonl"
-    write_jsonl(output_path, all_headings)
+    write_jsonl(HEADINGS_FILE, all_headings)
 
     # Write stats
     stats = {
@@ -5,18 +5,21 @@ Output structure compatible with https://bible.helloao.org/docs/
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .convert_usj import parse_usj_file
-from .types import BOOK_CODES, USJ_FILES
+from .convert_usj import parse_usj_file, usj_file_path
+from .types import BOOK_CODES
 from .utils import (
     BASE_DIR,
-    USJ_DIR,
     check_sources_exist,
+    encode_json,
     ensure_dir,
     log,
     log_book_progress,
+    worker_count,
+    write_files,
     write_json,
 )
 
@@ -94,6 +97,21 @@ BOOK_NAMES: dict[str, str] = {
 }
 
 
+# Per-book metadata in canonical order: (book_num, book_code, book_name, usj_path)
+HELLOAO_BOOKS: tuple[tuple[int, str, str, Path | None], ...] = tuple(
+    (num, code, BOOK_NAMES.get(code, code), usj_file_path(code)) for num, code in BOOK_CODES.items()
+)
+
+# Translation block shared by every chapter file
+HELLOAO_TRANSLATION: dict[str, str] = {
+    "id": "BSB",
+    "name": "Berean Standard Bible",
+    "language": "en",
+    "license": "CC0",
+    "website": "https://berean.bible",
+}
+
+
 def words_to_helloao_content(words: list[tuple[str, str | None]]) -> list[Any]:
     """Convert word pairs to helloao content format."""
     content: list[Any] = []
@@ -112,8 +130,54 @@ def words_to_helloao_content(words: list[tuple[str, str | None]]) -> list[Any]:
     return content
 
 
+def _build_book(book_num: int, book_code: str, book_name: str, usj_path: Path) -> int:
+    """Write the helloao chapter files for one book.
+
+    Runs in a worker process. Returns the number of chapters written.
+    """
+    verses = parse_usj_file(usj_path)
+
+    # Group verses by chapter
+    chapters: dict[int, list[dict[str, Any]]] = {}
+    for verse in verses:
+        ch = verse["c"]
+        if ch not in chapters:
+            chapters[ch] = []
+        chapters[ch].append(verse)
+
+    # Create book directory
+    book_dir = HELLOAO_DIR / book_code
+    ensure_dir(book_dir)
+
+    # The book entry is the same for every chapter, so it is built once
+    book = {"id": book_code, "name": book_name, "number": book_num}
+
+    # Encode each chapter, then write them all as one batch
+    chapter_files: list[tuple[Path, bytes]] = []
+    for ch_num, ch_verses in sorted(chapters.items()):
+        chapter_content: list[dict[str, Any]] = []
+
+        for v in ch_verses:
+            verse_content = words_to_helloao_content(v["w"])
+            chapter_content.append({"type": "verse", "number": v["v"], "content": verse_content})
+
+        chapter_data = {
+            "translation": HELLOAO_TRANSLATION,
+            "book": book,
+            "chapter": {"number": ch_num, "content": chapter_content, "footnotes": []},
+        }
+        chapter_files.append((book_dir / f"{ch_num}.json", encode_json(chapter_data)))
+
+    write_files(chapter_files)
+    return len(chapters)
+
+
 def build_helloao() -> None:
-    """Build helloao-compatible output."""
+    """Build helloao-compatible output.
+
+    Books are independent, so each one is parsed and written in a worker
+    process; results are collected in book order.
+    """
     log("Building helloao output...")
 
     # Check sources exist
@@ -129,77 +193,39 @@ def build_helloao() -> None:
 
     # Build books list
     books_list: list[dict[str, Any]] = []
-    total_books = len(BOOK_CODES)
-
-    for book_num, book_code in BOOK_CODES.items():
-        log_book_progress(book_num, total_books, book_code)
+    total_books = len(HELLOAO_BOOKS)
+
+    with ProcessPoolExecutor(max_workers=worker_count()) as executor:
+        futures = {}
+        for book_num, book_code, book_name, usj_path in HELLOAO_BOOKS:
+            if usj_path is not None and usj_path.exists():
+                futures[book_num] = executor.submit(
+                    _build_book, book_num, book_code, book_name, usj_path
+                )
 
-        # Get USJ file path
-        usj_filename = USJ_FILES.get(book_code)
-        if not usj_filename:
-            log(f"  WARNING: No USJ file mapping for {book_code}")
-            continue
+        for book_num, book_code, book_name, usj_path in HELLOAO_BOOKS:
+            log_book_progress(book_num, total_books, book_code)
 
-        usj_path = USJ_DIR / usj_filename
-        if not usj_path.exists():
-            log(f"  WARNING: USJ file not found: {usj_path}")
-            continue
+            if usj_path is None:
+                log(f"  WARNING: No USJ file mapping for {book_code}")
+                continue
+            if book_num not in futures:
+                log(f"  WARNING: USJ file not found: {usj_path}")
+                continue
 
-        # Parse USJ file
-        verses = parse_usj_file(usj_path)
-
-        # Group verses by chapter
-        chapters: dict[int, list[dict[str, Any]]] = {}
-        for verse in verses:
-            ch = verse["c"]
-            if ch not in chapters:
-                chapters[ch] = []
-            chapters[ch].append(verse)
-
-        # Create book directory
-        book_dir = HELLOAO_DIR / book_code
-        ensure_dir(book_dir)
-
-        # Write each chapter
-        for ch_num, ch_verses in sorted(chapters.items()):
-            chapter_content: list[dict[str, Any]] = []
-
-            for v in ch_verses:
-                verse_content = words_to_helloao_content(v["w"])
-                chapter_content.append(
-                    {"type": "verse", "number": v["v"], "content": verse_content}
-                )
+            chapter_count = futures[book_num].result()
 
-            chapter_data = {
-                "translation": {
-                    "id": "BSB",
-                    "name": "Berean Standard Bible",
-                    "language": "en",
-                    "license": "CC0",
-                    "website": "https://berean.bible",
-                },
-                "book": {
+            # Add to books list
+            books_list.append(
+                {
                     "id": book_code,
-                    "name": BOOK_NAMES.get(book_code, book_code),
+                    "name": book_name,
                     "number": book_num,
-                },
-                "chapter": {"number": ch_num, "content": chapter_content, "footnotes": []},
-            }
-
-            chapter_path = book_dir / f"{ch_num}.json"
-            write_json(chapter_path, chapter_data)
-
-        # Add to books list
-        books_list.append(
-            {
-                "id": book_code,
-                "name": BOOK_NAMES.get(book_code, book_code),
-                "number": book_num,
-                "chapters": len(chapters),
-            }
-        )
-
-        log(f"  Wrote {len(chapters)} chapters")
+                    "chapters": chapter_count,
+                }
+            )
+
+            log(f"  Wrote {chapter_count} chapters")
 
     # Write books.json
     write_json(HELLOAO_DIR / "books.json", books_list)
@@ -1,42 +1,95 @@
 #!/usr/bin/env python3
 """Build CC-BY index output - includes OSHB morphology data."""
 
+import argparse
 import sys
+from collections.abc import Collection, Iterator
 from pathlib import Path
-from typing import Any
 
-from .build_headings import build_headings
-from .convert_usj import parse_usj_file
+from .build_headings import build_headings, load_verse_headings
+from .convert_usj import map_usj_books
 from .enrich_gloss import load_strongs_pronunciation, merge_pronunciation_with_ubs
-from .enrich_marble import build_marble_index, enrich_with_marble
-from .enrich_morphology import enrich_with_morphology, load_oshb_morphology
-from .enrich_parallel import build_parallel_index, enrich_with_parallels
-from .enrich_topics import enrich_with_topics, load_topics
-from .enrich_ubs import enrich_with_ubs, load_ubs_lexicon
-from .enrich_ubs_refs import enrich_with_sense_data, load_ubs_sense_index
-from .enrich_xrefs import enrich_with_xrefs, load_cross_references
-from .types import BOOK_CODES, USJ_FILES, BuildStats, IndexVerseCCBY
+from .enrich_marble import build_marble_index, enrich_verse_with_marble
+from .enrich_morphology import enrich_verse_with_morphology, load_oshb_morphology
+from .enrich_parallel import build_parallel_index, enrich_verse_with_parallels
+from .enrich_topics import enrich_verse_with_topics, load_topics
+from .enrich_ubs import enrich_verse_with_ubs, load_ubs_lexicon
+from .enrich_ubs_refs import enrich_verse_with_sense_data, load_ubs_sense_index
+from .enrich_xrefs import enrich_verse_with_xrefs, load_cross_references
+from .parse_cache import get_parsed_book
+from .types import BuildStats, IndexVerseCCBY
 from .utils import (
     INDEX_CC_BY_DIR,
-    USJ_DIR,
     check_oshb_exists,
     check_sources_exist,
     ensure_dir,
-    extract_strongs_from_words,
     format_file_size,
     log,
-    log_book_progress,
     verse_id,
-    words_to_plain_text,
     write_json,
     write_jsonl,
 )
 
+# Enrichers that can be skipped for quick development builds (see main())
+OPTIONAL_ENRICHERS = ("ubs", "morphology", "marble", "parallels")
 
-def build_index_cc_by() -> BuildStats:
-    """Build CC-BY index output with morphology."""
+
+def _process_book(book_code: str, usj_path: Path) -> tuple[list[IndexVerseCCBY], BuildStats]:
+    """Convert one book's parsed verses to index format.
+
+    Runs in a worker process; returns the book's verses and its partial stats.
+    """
+    stats = BuildStats(books_processed=1)
+    book_verses: list[IndexVerseCCBY] = []
+
+    for pv in get_parsed_book(book_code, usj_path):
+        strongs_list = pv["s"]
+
+        # Update stats
+        stats.total_verses += 1
+        stats.total_words += pv["word_count"]
+        stats.words_with_strongs += pv["strongs_word_count"]
+        stats.unique_strongs.update(strongs_list)
+
+        # Build index verse (CC-BY format with morphology)
+        index_verse: IndexVerseCCBY = {
+            "id": verse_id(pv["b"], pv["c"], pv["v"]),
+            "b": pv["b"],
+            "c": pv["c"],
+            "v": pv["v"],
+            "t": pv["t"],
+            "s": strongs_list,
+            "x": [],  # Will be filled by enrichment
+            "tp": [],  # Will be filled by enrichment
+            "g": {},  # Will be filled by enrichment
+            "m": [],  # Will be filled by enrichment
+        }
+
+        # Add citations if present
+        if "citations" in pv:
+            index_verse["citations"] = pv["citations"]  # type: ignore
+
+        book_verses.append(index_verse)
+
+    return book_verses, stats
+
+
+def build_index_cc_by(skip_enrichers: Collection[str] = ()) -> BuildStats:
+    """Build CC-BY index output with morphology.
+
+    skip_enrichers names OPTIONAL_ENRICHERS to leave out for quick development
+    builds: their data is not loaded and their fields stay empty. The default
+    builds everything.
+    """
     log("Building CC-BY index output...")
 
+    skipped = sorted(set(skip_enrichers))
+    unknown = [name for name in skipped if name not in OPTIONAL_ENRICHERS]
+    if unknown:
+        log(f"ERROR: Unknown enrichers: {', '.join(unknown)}")
+        log(f"  Choose from: {', '.join(OPTIONAL_ENRICHERS)}")
+        sys.exit(1)
+
     # Check sources exist
     exists, missing = check_sources_exist()
     if not exists:
@@ -53,152 +106,89 @@ def build_index_cc_by() -> BuildStats:
     # Ensure output directory exists
     ensure_dir(INDEX_CC_BY_DIR)
 
-    # Build headings index first (returns verse-to-heading mapping)
-    log("")
-    verse_to_headings = build_headings()
+    # Headings are built by their own stage, which runs first
+    verse_to_headings = load_verse_headings()
 
     # Load enrichment data
     log("")
     log("Loading enrichment data...")
+    if skipped:
+        log(f"WARNING: Skipping enrichers: {', '.join(skipped)} (not a production build)")
     xrefs = load_cross_references()
     topics = load_topics()
-    ubs_lexicon = load_ubs_lexicon()
-    pronunciation = load_strongs_pronunciation()
-    morphology = load_oshb_morphology()
-    sense_index = load_ubs_sense_index()
-    marble_index = build_marble_index()
-    parallel_index = build_parallel_index()
+    use_ubs = "ubs" not in skipped
+    ubs_lexicon = load_ubs_lexicon() if use_ubs else {}
+    pronunciation = load_strongs_pronunciation() if use_ubs else {}
+    morphology = load_oshb_morphology() if "morphology" not in skipped else {}
+    sense_index = load_ubs_sense_index() if use_ubs else {}
+    marble_index = build_marble_index() if "marble" not in skipped else {}
+    parallel_index = build_parallel_index() if "parallels" not in skipped else {}
 
     log("")
     log("Processing books...")
 
     stats = BuildStats()
-    all_verses: list[IndexVerseCCBY] = []
-    total_books = len(BOOK_CODES)
-    verses_with_morph = 0
-
-    for book_num, book_code in BOOK_CODES.items():
-        log_book_progress(book_num, total_books, book_code)
-
-        # Get USJ file path
-        usj_filename = USJ_FILES.get(book_code)
-        if not usj_filename:
-            log(f"  WARNING: No USJ file mapping for {book_code}")
-            continue
-
-        usj_path = USJ_DIR / usj_filename
-        if not usj_path.exists():
-            log(f"  WARNING: USJ file not found: {usj_path}")
-            continue
-
-        # Parse USJ file
-        display_verses = parse_usj_file(usj_path)
-        stats.books_processed += 1
-
-        # Convert to index format
-        for dv in display_verses:
-            words = dv["w"]
-            vid = verse_id(dv["b"], dv["c"], dv["v"])
-
-            # Extract data
-            plain_text = words_to_plain_text(words)
-            strongs_list = extract_strongs_from_words(words)
-
-            # Update stats
-            stats.total_verses += 1
-            stats.total_words += len(words)
-            stats.words_with_strongs += sum(1 for _, s in words if s)
-            stats.unique_strongs.update(strongs_list)
-
-            # Build index verse (CC-BY format with morphology)
-            index_verse: IndexVerseCCBY = {
-                "id": vid,
-                "b": dv["b"],
-                "c": dv["c"],
-                "v": dv["v"],
-                "t": plain_text,
-                "s": strongs_list,
-                "x": [],  # Will be filled by enrichment
-                "tp": [],  # Will be filled by enrichment
-                "g": {},  # Will be filled by enrichment
-                "m": [],  # Will be filled by enrichment
-            }
-
-            # Add citations if present
-            if dv.get("citations"):
-                index_verse["citations"] = dv["citations"]  # type: ignore
-
-            # Add heading references if this verse has headings before it
-            if vid in verse_to_headings:
-                index_verse["h"] = verse_to_headings[vid]  # type: ignore
-
-            all_verses.append(index_verse)
-
-        log(f"  Processed {len(display_verses)} verses")
-
-    # Enrich all verses
-    log("")
-    log("Enriching verses...")
-
-    log("  Adding cross-references...")
-    all_verses = enrich_with_xrefs(all_verses, xrefs)
-
-    log("  Adding topics...")
-    all_verses = enrich_with_topics(all_verses, topics)
-
-    log("  Adding UBS lexicon data (CC-BY-SA content)...")
-    all_verses = enrich_with_ubs(all_verses, ubs_lexicon)
-
-    log("  Merging pronunciation data...")
-    # Merge pronunciation into each verse's 'g' field
-    for verse in all_verses:
-        if "g" in verse:
-            verse["g"] = merge_pronunciation_with_ubs(verse["g"], pronunciation)
-
-    log("  Adding morphology (CC-BY content)...")
-    all_verses = enrich_with_morphology(all_verses, morphology)
-
-    log("  Adding UBS sense disambiguation...")
-    all_verses = enrich_with_sense_data(all_verses, sense_index)
-
-    log("  Adding MARBLE media links (CC-BY-SA content)...")
-    all_verses = enrich_with_marble(all_verses, marble_index)
-
-    log("  Adding parallel passage references...")
-    all_verses = enrich_with_parallels(all_verses, parallel_index)
-
-    # Count enrichment stats
-    verses_with_sense = 0
-    verses_with_images = 0
-    verses_with_maps = 0
-    verses_with_parallels = 0
-    for v in all_verses:
-        stats.total_cross_references += len(v.get("x", []))
-        stats.total_topics += len(v.get("tp", []))
-        if v.get("m"):
-            verses_with_morph += 1
-        if v.get("ws"):
-            verses_with_sense += 1
-        if v.get("img"):
-            verses_with_images += 1
-        if v.get("map"):
-            verses_with_maps += 1
-        if v.get("par"):
-            verses_with_parallels += 1
-
-    # Write output
-    log("")
-    log("Writing output...")
+    enrichment_counts = {
+        "verses_with_morphology": 0,
+        "verses_with_sense_data": 0,
+        "verses_with_images": 0,
+        "verses_with_maps": 0,
+        "verses_with_parallels": 0,
+    }
+
+    def index_verses() -> Iterator[IndexVerseCCBY]:
+        """Yield each verse enriched and ready to write, without holding all of them."""
+        nonlocal stats
+
+        # Books are parsed and converted in worker processes, collected in book order
+        for _book_num, _book_code, (book_verses, book_stats) in map_usj_books(_process_book):
+            stats += book_stats
+
+            for index_verse in book_verses:
+                # Add heading references if this verse has headings before it
+                vid = index_verse["id"]
+                if vid in verse_to_headings:
+                    index_verse["h"] = verse_to_headings[vid]  # type: ignore
+
+                # Enrich: cross-references, topics, UBS lexicon data (CC-BY-SA content)
+                # with pronunciation merged in, morphology (CC-BY content), UBS sense
+                # disambiguation, MARBLE media links (CC-BY-SA content), parallels
+                enrich_verse_with_xrefs(index_verse, xrefs)
+                enrich_verse_with_topics(index_verse, topics)
+                enrich_verse_with_ubs(index_verse, ubs_lexicon)
+                merge_pronunciation_with_ubs(index_verse["g"], pronunciation)
+                enrich_verse_with_morphology(index_verse, morphology)
+                enrich_verse_with_sense_data(index_verse, sense_index)
+                enrich_verse_with_marble(index_verse, marble_index)
+                enrich_verse_with_parallels(index_verse, parallel_index)
+
+                # Count enrichment stats
+                stats.total_cross_references += len(index_verse["x"])
+                stats.total_topics += len(index_verse["tp"])
+                if index_verse["m"]:
+                    enrichment_counts["verses_with_morphology"] += 1
+                if "ws" in index_verse:
+                    enrichment_counts["verses_with_sense_data"] += 1
+                if "img" in index_verse:
+                    enrichment_counts["verses_with_images"] += 1
+                if "map" in index_verse:
+                    enrichment_counts["verses_with_maps"] += 1
+                if "par" in index_verse:
+                    enrichment_counts["verses_with_parallels"] += 1
+
+                yield index_verse
+
+            log(f"  Processed {len(book_verses)} verses")
+
+    # Verses are enriched and written as each book comes in
     output_path = INDEX_CC_BY_DIR / "bible-index.jsonl"
-    write_jsonl(output_path, all_verses)
+    output_size = write_jsonl(output_path, index_verses())
 
     # Write stats with all enrichment info
     stats_dict = stats.to_dict()
-    stats_dict["verses_with_morphology"] = verses_with_morph
-    stats_dict["verses_with_sense_data"] = verses_with_sense
-    stats_dict["verses_with_images"] = verses_with_images
-    stats_dict["verses_with_maps"] = verses_with_maps
-    stats_dict["verses_with_parallels"] = verses_with_parallels
+    stats_dict.update(enrichment_counts)
+    if skipped:
+        stats_dict["enrichers_skipped"] = skipped
     stats_path = INDEX_CC_BY_DIR / "stats.json"
     write_json(stats_path, stats_dict)
 
@@ -212,13 +202,12 @@ def build_index_cc_by() -> BuildStats:
     log(f"Unique Strong's numbers: {len(stats.unique_strongs)}")
     log(f"Total cross-references: {stats.total_cross_references}")
     log(f"Total topic assignments: {stats.total_topics}")
-    log(f"Verses with morphology: {verses_with_morph}")
-    log(f"Verses with sense data: {verses_with_sense}")
-    log(f"Verses with images: {verses_with_images}")
-    log(f"Verses with maps: {verses_with_maps}")
-    log(f"Verses with parallels: {verses_with_parallels}")
+    log(f"Verses with morphology: {enrichment_counts['verses_with_morphology']}")
+    log(f"Verses with sense data: {enrichment_counts['verses_with_sense_data']}")
+    log(f"Verses with images: {enrichment_counts['verses_with_images']}")
+    log(f"Verses with maps: {enrichment_counts['verses_with_maps']}")
+    log(f"Verses with parallels: {enrichment_counts['verses_with_parallels']}")
 
-    output_size = output_path.stat().st_size
     log(f"Output file: {output_path}")
     log(f"Output size: {format_file_size(output_size)}")
 
@@ -233,7 +222,20 @@ def build_index_cc_by() -> BuildStats:
 
 def main() -> None:
     """Main entry point."""
-    build_index_cc_by()
+    parser = argparse.ArgumentParser(description="Build CC-BY index output")
+    parser.add_argument(
+        "--no-ubs", action="store_true", help="Skip UBS lexicon, pronunciation and sense data"
+    )
+    parser.add_argument("--no-morphology", action="store_true", help="Skip OSHB morphology")
+    parser.add_argument("--no-marble", action="store_true", help="Skip MARBLE media links")
+    parser.add_argument("--no-parallels", action="store_true", help="Skip parallel passages")
+    args = parser.parse_args()
+
+    build_headings()
+    log("")
+    build_index_cc_by(
+        skip_enrichers=[name for name in OPTIONAL_ENRICHERS if getattr(args, f"no_{name}")]
+    )
 
 
 if __name__ == "__main__":
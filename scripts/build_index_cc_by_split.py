@@ -3,21 +3,27 @@
 
 import sys
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from .types import BOOK_CODES, BuildStats, IndexVerseCCBY
 from .utils import (
     INDEX_CC_BY_DIR,
     INDEX_CC_BY_SPLIT_DIR,
+    encode_jsonl,
     ensure_dir,
     format_file_size,
+    iter_jsonl,
     log,
     log_book_progress,
-    read_jsonl,
+    write_files,
     write_json,
-    write_jsonl,
 )
 
+# Optional verse fields copied to chapter files when present, in output order
+OPTIONAL_FIELDS = ("h", "citations", "dom", "ws", "img", "map", "msense", "par")
+
 
 def build_index_cc_by_split() -> BuildStats:
     """Build split CC-BY index output from the main index file.
@@ -37,41 +43,38 @@ def build_index_cc_by_split() -> BuildStats:
     # Ensure output directory exists
     ensure_dir(INDEX_CC_BY_SPLIT_DIR)
 
-    # Load all verses from the main index
-    log("Loading CC-BY index...")
-    all_verses: list[IndexVerseCCBY] = read_jsonl(source_path)
-    log(f"  Loaded {len(all_verses)} verses")
-
-    # Group verses by book and chapter
-    log("Grouping verses by book and chapter...")
-    verses_by_book_chapter: dict[str, dict[int, list[IndexVerseCCBY]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-
-    for verse in all_verses:
-        book = verse["b"]
-        chapter = verse["c"]
-        verses_by_book_chapter[book][chapter].append(verse)
+    # Stream the main index one book at a time. build_index_cc_by writes
+    # books whole and in canonical order, so only one book is held at once.
+    log("Streaming CC-BY index...")
+    books = groupby(iter_jsonl(source_path), key=itemgetter("b"))
+    next_book = next(books, None)
 
     # Write output files
     log("Writing chapter files...")
     stats = BuildStats()
     total_books = len(BOOK_CODES)
     files_written = 0
+    total_size = 0
 
     for book_num, book_code in BOOK_CODES.items():
         log_book_progress(book_num, total_books, book_code)
 
-        if book_code not in verses_by_book_chapter:
+        if next_book is None or next_book[0] != book_code:
             log(f"  WARNING: No verses found for {book_code}")
             continue
 
+        # Group the book's verses by chapter
+        chapters: dict[int, list[IndexVerseCCBY]] = defaultdict(list)
+        for verse in next_book[1]:
+            chapters[verse["c"]].append(verse)
+        next_book = next(books, None)
+
         # Create book directory
         book_dir = INDEX_CC_BY_SPLIT_DIR / book_code
         ensure_dir(book_dir)
 
-        chapters = verses_by_book_chapter[book_code]
         stats.books_processed += 1
+        chapter_files: list[tuple[Path, bytes]] = []
 
         for chapter_num in sorted(chapters.keys()):
             chapter_verses = chapters[chapter_num]
@@ -87,34 +90,26 @@ def build_index_cc_by_split() -> BuildStats:
                     "m": verse.get("m", []),
                 }
                 # Only include optional fields if present
-                if "h" in verse:
-                    compact_verse["h"] = verse["h"]
-                if "citations" in verse:
-                    compact_verse["citations"] = verse["citations"]
-                if "dom" in verse:
-                    compact_verse["dom"] = verse["dom"]
-                # New UBS enrichment fields
-                if "ws" in verse:
-                    compact_verse["ws"] = verse["ws"]
-                if "img" in verse:
-                    compact_verse["img"] = verse["img"]
-                if "map" in verse:
-                    compact_verse["map"] = verse["map"]
-                if "msense" in verse:
-                    compact_verse["msense"] = verse["msense"]
-                if "par" in verse:
-                    compact_verse["par"] = verse["par"]
+                for key in OPTIONAL_FIELDS:
+                    if key in verse:
+                        compact_verse[key] = verse[key]
                 compact_verses.append(compact_verse)
 
-            # Write chapter file: {BOOK}/{BOOK}{chapter}.jsonl
+            # Chapter file: {BOOK}/{BOOK}{chapter}.jsonl, encoded in one piece
             output_path = book_dir / f"{book_code}{chapter_num}.jsonl"
-            write_jsonl(output_path, compact_verses)
+            chapter_files.append((output_path, encode_jsonl(compact_verses)))
 
             stats.total_verses += len(compact_verses)
             files_written += 1
 
+        total_size += write_files(chapter_files)
         log(f"  Wrote {len(chapters)} chapters")
 
+    if next_book is not None:
+        log(f"ERROR: CC-BY index is not in canonical book order (at {next_book[0]}).")
+        log("  Rebuild it with --index-cc-by.")
+        sys.exit(1)
+
     # Write stats
     stats_dict = stats.to_dict()
     stats_dict["files_written"] = files_written
@@ -128,8 +123,6 @@ def build_index_cc_by_split() -> BuildStats:
     log(f"Total verses: {stats.total_verses}")
     log(f"Chapter files written: {files_written}")
 
-    # Calculate total output size
-    total_size = sum(f.stat().st_size for f in INDEX_CC_BY_SPLIT_DIR.rglob("*.jsonl"))
     log(f"Total output size: {format_file_size(total_size)}")
 
     log("")
@@ -2,31 +2,67 @@
 """Build Public Domain index output - single JSONL file for vector DB indexing."""
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
-
-from .build_headings import build_headings
-from .convert_usj import parse_usj_file
-from .enrich_gloss import enrich_with_glosses, load_strongs_lexicon
-from .enrich_topics import enrich_with_topics, load_topics
-from .enrich_xrefs import enrich_with_xrefs, load_cross_references
-from .types import BOOK_CODES, USJ_FILES, BuildStats, IndexVersePD
+
+from .build_headings import build_headings, load_verse_headings
+from .convert_usj import map_usj_books
+from .enrich_gloss import enrich_verse_with_glosses, load_strongs_lexicon
+from .enrich_topics import enrich_verse_with_topics, load_topics
+from .enrich_xrefs import enrich_verse_with_xrefs, load_cross_references
+from .parse_cache import get_parsed_book
+from .types import BuildStats, IndexVersePD
 from .utils import (
     INDEX_PD_DIR,
-    USJ_DIR,
     check_sources_exist,
     ensure_dir,
-    extract_strongs_from_words,
     format_file_size,
     log,
-    log_book_progress,
     verse_id,
-    words_to_plain_text,
     write_json,
     write_jsonl,
 )
 
 
+def _process_book(book_code: str, usj_path: Path) -> tuple[list[IndexVersePD], BuildStats]:
+    """Convert one book's parsed verses to index format.
+
+    Runs in a worker process; returns the book's verses and its partial stats.
+    """
+    stats = BuildStats(books_processed=1)
+    book_verses: list[IndexVersePD] = []
+
+    for pv in get_parsed_book(book_code, usj_path):
+        strongs_list = pv["s"]
+
+        # Update stats
+        stats.total_verses += 1
+        stats.total_words += pv["word_count"]
+        stats.words_with_strongs += pv["strongs_word_count"]
+        stats.unique_strongs.update(strongs_list)
+
+        # Build index verse
+        index_verse: IndexVersePD = {
+            "id": verse_id(pv["b"], pv["c"], pv["v"]),
+            "b": pv["b"],
+            "c": pv["c"],
+            "v": pv["v"],
+            "t": pv["t"],
+            "s": strongs_list,
+            "x": [],  # Will be filled by enrichment
+            "tp": [],  # Will be filled by enrichment
+            "g": {},  # Will be filled by enrichment
+        }
+
+        # Add citations if present
+        if "citations" in pv:
+            index_verse["citations"] = pv["citations"]
+
+        book_verses.append(index_verse)
+
+    return book_verses, stats
+
+
 def build_index_pd() -> BuildStats:
     """Build Public Domain index output."""
     log("Building PD index output...")
@@ -42,9 +78,8 @@ def build_index_pd() -> BuildStats:
     # Ensure output directory exists
     ensure_dir(INDEX_PD_DIR)
 
-    # Build headings index first (returns verse-to-heading mapping)
-    log("")
-    verse_to_headings = build_headings()
+    # Headings are built by their own stage, which runs first
+    verse_to_headings = load_verse_headings()
 
     # Load enrichment data
     log("")
@@ -57,90 +92,37 @@ def build_index_pd() -> BuildStats:
     log("Processing books...")
 
     stats = BuildStats()
-    all_verses: list[IndexVersePD] = []
-    total_books = len(BOOK_CODES)
-
-    for book_num, book_code in BOOK_CODES.items():
-        log_book_progress(book_num, total_books, book_code)
-
-        # Get USJ file path
-        usj_filename = USJ_FILES.get(book_code)
-        if not usj_filename:
-            log(f"  WARNING: No USJ file mapping for {book_code}")
-            continue
-
-        usj_path = USJ_DIR / usj_filename
-        if not usj_path.exists():
-            log(f"  WARNING: USJ file not found: {usj_path}")
-            continue
-
-        # Parse USJ file
-        display_verses = parse_usj_file(usj_path)
-        stats.books_processed += 1
-
-        # Convert to index format
-        for dv in display_verses:
-            words = dv["w"]
-            vid = verse_id(dv["b"], dv["c"], dv["v"])
-
-            # Extract data
-            plain_text = words_to_plain_text(words)
-            strongs_list = extract_strongs_from_words(words)
-
-            # Update stats
-            stats.total_verses += 1
-            stats.total_words += len(words)
-            stats.words_with_strongs += sum(1 for _, s in words if s)
-            stats.unique_strongs.update(strongs_list)
-
-            # Build index verse
-            index_verse: IndexVersePD = {
-                "id": vid,
-                "b": dv["b"],
-                "c": dv["c"],
-                "v": dv["v"],
-                "t": plain_text,
-                "s": strongs_list,
-                "x": [],  # Will be filled by enrichment
-                "tp": [],  # Will be filled by enrichment
-                "g": {},  # Will be filled by enrichment
-            }
-
-            # Add citations if present
-            if dv.get("citations"):
-                index_verse["citations"] = dv["citations"]
-
-            # Add heading references if this verse has headings before it
-            if vid in verse_to_headings:
-                index_verse["h"] = verse_to_headings[vid]
-
-            all_verses.append(index_verse)
-
-        log(f"  Processed {len(display_verses)} verses")
-
-    # Enrich all verses
-    log("")
-    log("Enriching verses...")
 
-    log("  Adding cross-references...")
-    all_verses = enrich_with_xrefs(all_verses, xrefs)
+    def index_verses() -> Iterator[IndexVersePD]:
+        """Yield each verse enriched and ready to write, without holding all of them."""
+        nonlocal stats
 
-    log("  Adding topics...")
-    all_verses = enrich_with_topics(all_verses, topics)
+        # Books are parsed and converted in worker processes, collected in book order
+        for _book_num, _book_code, (book_verses, book_stats) in map_usj_books(_process_book):
+            stats += book_stats
 
-    log("  Adding glosses...")
-    all_verses = enrich_with_glosses(all_verses, lexicon)
+            for index_verse in book_verses:
+                # Add heading references if this verse has headings before it
+                vid = index_verse["id"]
+                if vid in verse_to_headings:
+                    index_verse["h"] = verse_to_headings[vid]
 
-    # Count enrichment stats
-    for v in all_verses:
-        stats.total_cross_references += len(v.get("x", []))
-        stats.total_topics += len(v.get("tp", []))
+                # Enrich with cross-references, topics and glosses
+                enrich_verse_with_xrefs(index_verse, xrefs)
+                enrich_verse_with_topics(index_verse, topics)
+                enrich_verse_with_glosses(index_verse, lexicon)
 
-    # Write output
-    log("")
-    log("Writing output...")
+                # Count enrichment stats
+                stats.total_cross_references += len(index_verse["x"])
+                stats.total_topics += len(index_verse["tp"])
+
+                yield index_verse
+
+            log(f"  Processed {len(book_verses)} verses")
+
+    # Verses are enriched and written as each book comes in
     output_path = INDEX_PD_DIR / "bible-index.jsonl"
-    write_jsonl(output_path, all_verses)
+    output_size = write_jsonl(output_path, index_verses())
 
     # Write stats
     stats_path = INDEX_PD_DIR / "stats.json"
@@ -157,7 +139,6 @@ def build_index_pd() -> BuildStats:
     log(f"Total cross-references: {stats.total_cross_references}")
     log(f"Total topic assignments: {stats.total_topics}")
 
-    output_size = output_path.stat().st_size
     log(f"Output file: {output_path}")
     log(f"Output size: {format_file_size(output_size)}")
 
@@ -166,6 +147,8 @@ def build_index_pd() -> BuildStats:
 
 def main() -> None:
     """Main entry point."""
+    build_headings()
+    log("")
     build_index_pd()
 
 
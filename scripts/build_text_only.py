@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
-"""Build text-only output format using plain USJ files via usfmtc.
+"""Build text-only output format from plain USJ files.
 
 Output format: {3 letter bookname}_{three digit chapter number}_BSB.txt
 with the text of each verse on a new line (no verse numbers).
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
-import usfmtc
+import orjson
 
 from .types import BOOK_CODES
 from .utils import (
@@ -17,6 +19,8 @@ from .utils import (
     ensure_dir,
     log,
     log_book_progress,
+    worker_count,
+    write_files,
 )
 
 # Output directory
@@ -27,43 +31,101 @@ PLAIN_USJ_FILES: dict[str, str] = {code: f"{code}.usj" for code in BOOK_CODES.va
 
 
 def extract_verses_from_usj(usj_path: Path) -> dict[int, dict[int, str]]:
-    """Extract verses from a plain USJ file using usfmtc.
+    """Extract verses from a plain USJ file.
+
+    The USJ JSON is walked directly in document order. A verse's text is
+    the run of strings right after its marker, which is the tail that
+    usfmtc's USJ-to-USX conversion gives the verse element.
 
     Returns: {chapter_num: {verse_num: text}}
     """
-    doc = usfmtc.readFile(str(usj_path))
-    root = doc.getroot()
+    usj = orjson.loads(usj_path.read_bytes())
 
     verses: dict[int, dict[int, str]] = {}
     current_chapter = 0
 
-    for elem in root.iter():
-        if elem.tag == "chapter":
-            current_chapter = int(elem.get("number", 0))
-            if current_chapter not in verses:
-                verses[current_chapter] = {}
-        elif elem.tag == "verse":
-            verse_num_str = elem.get("number", "")
-            # Skip verse ranges like "1-2" and end markers
-            if "-" in verse_num_str or elem.get("eid"):
-                continue
-            try:
-                verse_num = int(verse_num_str)
-            except ValueError:
+    def add_verse(chapter: int, verse_num_str: str, tail: str) -> None:
+        # Skip verse ranges like "1-2"
+        if "-" in verse_num_str:
+            return
+        try:
+            verse_num = int(verse_num_str)
+        except ValueError:
+            return
+        text = tail.strip()
+        if chapter and verse_num and text:
+            if verse_num not in verses[chapter]:
+                verses[chapter][verse_num] = text
+            else:
+                verses[chapter][verse_num] += " " + text
+
+    def walk(content: list[Any], nested: bool) -> None:
+        nonlocal current_chapter
+        # Verse marker waiting for the strings that follow it: (chapter, number)
+        pending: tuple[int, str] | None = None
+        tail = ""
+
+        for item in content:
+            if isinstance(item, str):
+                if pending is not None:
+                    # Inside an element each string replaces the previous tail;
+                    # at the top level the strings are concatenated
+                    tail = item if nested else tail + item
                 continue
-            # Get the text that follows the verse marker
-            text = elem.tail.strip() if elem.tail else ""
-            if current_chapter and verse_num and text:
-                if verse_num not in verses.get(current_chapter, {}):
-                    verses[current_chapter][verse_num] = text
-                else:
-                    verses[current_chapter][verse_num] += " " + text
 
+            if pending is not None:
+                add_verse(*pending, tail)
+                pending = None
+
+            node_type = item.get("type")
+            if node_type == "chapter":
+                current_chapter = int(item.get("number", 0))
+                if current_chapter not in verses:
+                    verses[current_chapter] = {}
+            elif node_type == "verse" and not item.get("eid"):
+                pending = (current_chapter, str(item.get("number", "")))
+                tail = ""
+
+            if "content" in item:
+                walk(item["content"], True)
+
+        if pending is not None:
+            add_verse(*pending, tail)
+
+    walk(usj.get("content", []), False)
     return verses
 
 
+def _build_book(usj_path: Path, book_code: str) -> tuple[int, int]:
+    """Extract one book's verses and write its chapter files.
+
+    Runs in a worker process; returns (chapters written, verses written).
+    """
+    chapters = extract_verses_from_usj(usj_path)
+
+    chapter_files: list[tuple[Path, bytes]] = []
+    book_verses = 0
+    for ch_num in sorted(chapters.keys()):
+        ch_verses = chapters[ch_num]
+
+        # Format: {3 letter bookname}_{three digit chapter number}_BSB.txt
+        filename = f"{book_code}_{ch_num:03d}_BSB.txt"
+
+        lines = [ch_verses[v_num] for v_num in sorted(ch_verses.keys())]
+        book_verses += len(lines)
+
+        chapter_files.append((TEXT_ONLY_DIR / filename, ("\n".join(lines) + "\n").encode("utf-8")))
+
+    write_files(chapter_files)
+    return len(chapter_files), book_verses
+
+
 def build_text_only() -> None:
-    """Build text-only output from plain USJ files."""
+    """Build text-only output from plain USJ files.
+
+    Books are independent, so each one is extracted and written in a worker
+    process; results are collected in book order.
+    """
     log("Building text-only output...")
 
     # Check plain USJ sources exist
@@ -79,47 +141,38 @@ def build_text_only() -> None:
     total_chapters = 0
     total_verses = 0
 
-    for book_num, book_code in BOOK_CODES.items():
-        log_book_progress(book_num, total_books, book_code)
+    with ProcessPoolExecutor(max_workers=worker_count()) as executor:
+        futures = {}
+        for book_num, book_code in BOOK_CODES.items():
+            usj_filename = PLAIN_USJ_FILES.get(book_code)
+            if usj_filename and (USJ_PLAIN_DIR / usj_filename).exists():
+                futures[book_num] = executor.submit(
+                    _build_book, USJ_PLAIN_DIR / usj_filename, book_code
+                )
+
+        for book_num, book_code in BOOK_CODES.items():
+            log_book_progress(book_num, total_books, book_code)
+
+            # Get plain USJ file path
+            usj_filename = PLAIN_USJ_FILES.get(book_code)
+            if not usj_filename:
+                log(f"  WARNING: No USJ file mapping for {book_code}")
+                continue
 
-        # Get plain USJ file path
-        usj_filename = PLAIN_USJ_FILES.get(book_code)
-        if not usj_filename:
-            log(f"  WARNING: No USJ file mapping for {book_code}")
-            continue
+            usj_path = USJ_PLAIN_DIR / usj_filename
+            if book_num not in futures:
+                log(f"  WARNING: USJ file not found: {usj_path}")
+                continue
 
-        usj_path = USJ_PLAIN_DIR / usj_filename
-        if not usj_path.exists():
-            log(f"  WARNING: USJ file not found: {usj_path}")
-            continue
+            try:
+                book_chapters, book_verses = futures[book_num].result()
+            except Exception as e:
+                log(f"  ERROR parsing {usj_path}: {e}")
+                continue
 
-        # Extract verses using usfmtc
-        try:
-            chapters = extract_verses_from_usj(usj_path)
-        except Exception as e:
-            log(f"  ERROR parsing {usj_path}: {e}")
-            continue
-
-        # Write each chapter to a file
-        book_chapters = 0
-        for ch_num in sorted(chapters.keys()):
-            ch_verses = chapters[ch_num]
-
-            # Format: {3 letter bookname}_{three digit chapter number}_BSB.txt
-            filename = f"{book_code}_{ch_num:03d}_BSB.txt"
-            filepath = TEXT_ONLY_DIR / filename
-
-            lines: list[str] = []
-            for v_num in sorted(ch_verses.keys()):
-                verse_text = ch_verses[v_num]
-                lines.append(verse_text)
-                total_verses += 1
-
-            filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
-            book_chapters += 1
-
-        total_chapters += book_chapters
-        log(f"  Wrote {book_chapters} chapters")
+            total_chapters += book_chapters
+            total_verses += book_verses
+            log(f"  Wrote {book_chapters} chapters")
 
     log("")
     log("=== Text-Only Build Complete ===")
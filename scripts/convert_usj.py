@@ -1,11 +1,17 @@
 """USJ Parser - Convert BSB-USJ format to DisplayVerse format."""
 
 import re
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from .types import DisplayVerse
-from .utils import normalize_strongs, read_json
+import orjson
+
+from .types import BOOK_CODES, USJ_FILES, DisplayVerse
+from .utils import USJ_DIR, log, log_book_progress, normalize_strongs, read_json, worker_count
+
+T = TypeVar("T")
 
 
 def parse_usj_file(file_path: Path) -> list[DisplayVerse]:
@@ -14,200 +20,254 @@ def parse_usj_file(file_path: Path) -> list[DisplayVerse]:
     return parse_usj_document(usj)
 
 
-def parse_usj_document(usj: dict[str, Any]) -> list[DisplayVerse]:
-    """Parse a USJ document and extract all verses."""
-    verses: list[DisplayVerse] = []
-    current_book = ""
-    current_chapter = 0
-    current_verse = 0
-    current_words: list[tuple[str, str | None]] = []
-    current_citations: list[str] = []
+def parse_usj_bytes(data: bytes) -> list[DisplayVerse]:
+    """Parse USJ file contents that were already read (e.g. to hash them)."""
+    return parse_usj_document(orjson.loads(data))
+
+
+def usj_file_path(book_code: str) -> Path | None:
+    """Return the Strong's USJ source path for a book code, or None if unmapped."""
+    usj_filename = USJ_FILES.get(book_code)
+    return USJ_DIR / usj_filename if usj_filename else None
+
+
+def map_usj_books(
+    process_book: Callable[[str, Path], T],
+) -> Iterator[tuple[int, str, T]]:
+    """Run process_book(book_code, usj_path) for every book in worker processes.
+
+    Books are independent, so each one is read and parsed in its own worker;
+    results are yielded in canonical order with progress logged as they are
+    collected. process_book must be a picklable top-level function. Books
+    without a USJ file are skipped with a warning.
+
+    Yields (book_num, book_code, result)
+    """
+    books = list(BOOK_CODES.items())
+    total_books = len(books)
+
+    with ProcessPoolExecutor(max_workers=worker_count()) as executor:
+        futures = {}
+        for book_num, book_code in books:
+            usj_path = usj_file_path(book_code)
+            if usj_path is not None and usj_path.exists():
+                futures[book_num] = executor.submit(process_book, book_code, usj_path)
+
+        for book_num, book_code in books:
+            log_book_progress(book_num, total_books, book_code)
+
+            usj_path = usj_file_path(book_code)
+            if usj_path is None:
+                log(f"  WARNING: No USJ file mapping for {book_code}")
+                continue
+            if book_num not in futures:
+                log(f"  WARNING: USJ file not found: {usj_path}")
+                continue
+
+            yield book_num, book_code, futures.pop(book_num).result()
+
+
+# Paragraph markers whose content is not verse text (section headers, references)
+SKIPPED_PARA_MARKERS = frozenset(("s1", "s2", "s3", "s4", "s5", "r", "sr", "mr", "d"))
+
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
+USJ_FILENAME_PATTERN = re.compile(r"^\d{2}([A-Z0-9]+)BSB")
+
+# Characters that shouldn't have space after them
+NO_SPACE_AFTER = frozenset(' "\'(["\u201c\u2018')
+# Characters that shouldn't have space before them
+NO_SPACE_BEFORE = frozenset(",.;:!?)]'\"\u201d\u2019")
 
-    def add_text(text: str) -> None:
-        """Add text to current verse."""
-        nonlocal current_words
-        if current_verse > 0:
-            # Check if we can merge with previous word that has no strongs
-            if current_words and current_words[-1][1] is None:
-                current_words[-1] = (current_words[-1][0] + text, None)
-            else:
-                current_words.append((text, None))
-
-    def extract_text(content: list[Any]) -> str:
-        """Extract plain text from content array."""
-        text = ""
-        for item in content:
-            if isinstance(item, str):
-                text += item
+
+def extract_text(content: list[Any]) -> str:
+    """Extract plain text from content array."""
+    parts: list[str] = []
+    stack = [iter(content)]
+    while stack:
+        for item in stack[-1]:
+            if type(item) is str:
+                parts.append(item)
             elif isinstance(item, dict) and "content" in item:
-                text += extract_text(item["content"])
-        return text
-
-    def extract_citations_from_note(note: dict[str, Any]) -> list[str]:
-        """Extract citation references from a footnote."""
-        citations = []
-        content = note.get("content", [])
-        for item in content:
+                stack.append(iter(item["content"]))
+                break
+        else:
+            stack.pop()
+    return "".join(parts)
+
+
+def extract_citations_from_note(note: dict[str, Any]) -> list[str]:
+    """Extract citation references (e.g. "2CO 4:6") from a footnote."""
+    citations: list[str] = []
+    stack = [iter(note.get("content", []))]
+    while stack:
+        for item in stack[-1]:
             if isinstance(item, dict):
                 if item.get("type") == "ref":
-                    # Extract the location (e.g., "2CO 4:6")
                     loc = item.get("loc", "")
                     if loc:
                         citations.append(loc)
                 elif "content" in item:
-                    # Recurse into nested content
-                    citations.extend(extract_citations_from_note(item))
-        return citations
-
-    def process_char(char: dict[str, Any]) -> None:
-        """Process a char element (may contain Strong's number or nested content)."""
-        nonlocal current_words
-
-        marker = char.get("marker")
-        content = char.get("content", [])
-
-        if marker == "w" and char.get("strong"):
-            # Word with Strong's number - only process if we're in a verse
-            if current_verse > 0:
-                text = extract_text(content)
-                strongs = normalize_strongs(char["strong"])
-                current_words.append((text, strongs))
+                    stack.append(iter(item["content"]))
+                    break
         else:
-            # Other char types (wj, add, etc.) - may contain nested verses/words
-            # Process content recursively to find verses and words inside
-            process_content(content)
+            stack.pop()
+    return citations
 
-    def clean_words(words: list[tuple[str, str | None]]) -> list[tuple[str, str | None]]:
-        """Clean and normalize word array with proper spacing."""
-        result: list[tuple[str, str | None]] = []
 
-        for text, strongs in words:
-            # Skip empty text
-            if not text and not strongs:
-                continue
+def clean_words(
+    texts: list[str], strongs_list: list[str | None]
+) -> tuple[list[str], list[str | None]]:
+    """Clean and normalize parallel word text/Strong's lists with proper spacing.
+
+    Adjacent entries without Strong's numbers are merged, so the result never
+    has two None entries in a row.
+    """
+    result_texts: list[str] = []
+    result_strongs: list[str | None] = []
+
+    for text, strongs in zip(texts, strongs_list):
+        # Skip empty text
+        if not text and not strongs:
+            continue
+
+        # Normalize whitespace in text. Every whitespace character except a
+        # plain space is non-printable, so most words skip the regex entirely.
+        if "  " in text or not text.isprintable():
+            text = WHITESPACE_RUN_PATTERN.sub(" ", text)
+
+        # Merge with previous if both have no strongs
+        if strongs is None and result_strongs and result_strongs[-1] is None:
+            result_texts[-1] += text
+            continue
+
+        # Add space before this word if needed
+        if result_texts and strongs is not None:
+            prev_text = result_texts[-1]
+            # Don't add space after opening punctuation or before closing
+            # punctuation (or empty text)
+            if (
+                prev_text
+                and prev_text[-1] not in NO_SPACE_AFTER
+                and text
+                and text[0] not in NO_SPACE_BEFORE
+            ):
+                if result_strongs[-1] is None:
+                    result_texts[-1] += " "
+                else:
+                    result_texts.append(" ")
+                    result_strongs.append(None)
+        result_texts.append(text)
+        result_strongs.append(strongs)
+
+    # Trim leading/trailing whitespace from first and last entries
+    if result_texts:
+        result_texts[0] = result_texts[0].lstrip()
+        result_texts[-1] = result_texts[-1].rstrip()
+
+    return result_texts, result_strongs
+
 
-            # Normalize whitespace in text
-            text = re.sub(r"\s+", " ", text)
-
-            # Merge with previous if both have no strongs
-            if strongs is None and result and result[-1][1] is None:
-                result[-1] = (result[-1][0] + text, None)
-            else:
-                # Add space before this word if needed
-                if result and strongs is not None:
-                    prev_text, prev_strongs = result[-1]
-                    # Check if we need a space between words
-                    needs_space = False
-                    if prev_text:
-                        last_char = prev_text[-1]
-                        first_char = text[0] if text else ""
-                        # Characters that shouldn't have space after them
-                        no_space_after = ' "\'(["\u201c\u2018'
-                        # Characters that shouldn't have space before them
-                        no_space_before = ',.;:!?)]\'""\u201d\u2019'
-                        # Don't add space after opening punctuation
-                        if last_char in no_space_after:
-                            needs_space = False
-                        # Don't add space before closing punctuation
-                        elif first_char in no_space_before:
-                            needs_space = False
-                        # Add space between words
-                        else:
-                            needs_space = True
-                    if needs_space:
-                        result.append((" ", None))
-                result.append((text, strongs))
-
-        # Merge adjacent non-strongs entries
-        merged: list[tuple[str, str | None]] = []
-        for text, strongs in result:
-            if strongs is None and merged and merged[-1][1] is None:
-                merged[-1] = (merged[-1][0] + text, None)
-            else:
-                merged.append((text, strongs))
-
-        # Trim leading/trailing whitespace from first and last entries
-        if merged:
-            merged[0] = (merged[0][0].lstrip(), merged[0][1])
-            merged[-1] = (merged[-1][0].rstrip(), merged[-1][1])
-
-        return merged
+def parse_usj_document(usj: dict[str, Any]) -> list[DisplayVerse]:
+    """Parse a USJ document and extract all verses.
+
+    The content tree is walked depth-first with an explicit stack of content
+    iterators rather than recursion, so parser state stays in plain locals.
+    """
+    verses: list[DisplayVerse] = []
+    current_book = ""
+    current_chapter = 0
+    current_verse = 0
+    # Word texts and their Strong's numbers, kept as parallel lists (reused per verse)
+    current_texts: list[str] = []
+    current_strongs: list[str | None] = []
+    current_citations: list[str] = []
+    # Plain text fragments since the last Strong's word, joined once per run
+    pending_plain: list[str] = []
+
+    def flush_plain() -> None:
+        """Add the pending plain text run as a single word without Strong's."""
+        if pending_plain:
+            current_texts.append("".join(pending_plain))
+            current_strongs.append(None)
+            pending_plain.clear()
 
     def save_current_verse() -> None:
         """Save the current verse if valid."""
-        nonlocal current_words, current_citations
-        if current_book and current_chapter > 0 and current_verse > 0 and current_words:
+        flush_plain()
+        if current_book and current_chapter > 0 and current_verse > 0 and current_texts:
             # Clean up words - merge adjacent null-strongs entries and add spacing
-            cleaned_words = clean_words(current_words)
-
-            # Convert to list format for JSON serialization
-            w_list: list[tuple[str, str | None]] = [(t, s) for t, s in cleaned_words]
-
+            texts, strongs = clean_words(current_texts, current_strongs)
             verse_data: DisplayVerse = {
                 "b": current_book,
                 "c": current_chapter,
                 "v": current_verse,
-                "w": w_list,
+                "w": list(zip(texts, strongs)),
             }
 
-            # Add citations if present
+            # Add citations if present (handed over: the caller starts a new list)
             if current_citations:
-                verse_data["citations"] = current_citations.copy()  # type: ignore
+                verse_data["citations"] = current_citations
 
             verses.append(verse_data)
-        current_words = []
-        current_citations = []
 
-    def process_content(content: list[Any]) -> None:
-        """Recursive function to process content."""
-        nonlocal current_book, current_chapter, current_verse, current_words, current_citations
+        # clean_words built new lists, so the buffers are reused for the next verse
+        current_texts.clear()
+        current_strongs.clear()
 
-        for item in content:
-            if isinstance(item, str):
+    stack = [iter(usj.get("content", []))]
+    while stack:
+        for item in stack[-1]:
+            if type(item) is str:
                 # Plain text (punctuation, spaces, etc.)
-                if item.strip() or item == " ":
-                    add_text(item)
-            elif isinstance(item, dict):
-                item_type = item.get("type")
-
-                if item_type == "book":
-                    # Extract book code
-                    current_book = item.get("code", "")
-                elif item_type == "chapter":
-                    # Save previous verse if exists
-                    save_current_verse()
-                    current_chapter = int(item.get("number", 0))
-                    current_verse = 0
-                elif item_type == "verse":
-                    # Save previous verse if exists
-                    save_current_verse()
-                    current_verse = int(item.get("number", 0))
-                    current_words = []
-                    current_citations = []
-                elif item_type == "para":
-                    # Skip section headers (s1, s2, etc.) and references (r)
-                    marker = item.get("marker", "")
-                    if marker in ("s1", "s2", "s3", "s4", "s5", "r", "sr", "mr", "d"):
-                        # Don't include section headers or references in verse text
-                        continue
-                    # Process paragraph content
-                    if "content" in item:
-                        process_content(item["content"])
-                elif item_type == "char":
-                    # Character style - may contain Strong's number
-                    process_char(item)
-                elif item_type == "note":
-                    # Footnote - extract citations but don't include note text
-                    citations = extract_citations_from_note(item)
-                    if citations:
-                        current_citations.extend(citations)
-                    # Don't process note content as verse text
-                elif "content" in item:
-                    # Other elements with content - recurse
-                    process_content(item["content"])
+                if current_verse > 0 and (item == " " or item.strip()):
+                    pending_plain.append(item)
+                continue
+            if not isinstance(item, dict):
+                continue
 
-    # Process the document
-    process_content(usj.get("content", []))
+            # Look each key up once: type, then content, then marker-specific keys
+            item_type = item.get("type")
+            content = item.get("content")
+            if item_type == "char":
+                # Character style - may contain Strong's number
+                if item.get("marker") == "w" and (strong := item.get("strong")):
+                    # Word with Strong's number - only kept if we're in a verse
+                    if current_verse > 0:
+                        flush_plain()
+                        current_texts.append(extract_text(content) if content else "")
+                        current_strongs.append(normalize_strongs(strong))
+                    continue
+                # Other char types (wj, add, etc.) - may contain nested verses/words
+                if content:
+                    stack.append(iter(content))
+                    break
+            elif item_type == "para":
+                # Skip section headers and references - not verse text
+                if content is None or item.get("marker", "") in SKIPPED_PARA_MARKERS:
+                    continue
+                stack.append(iter(content))
+                break
+            elif item_type == "verse":
+                save_current_verse()
+                current_verse = int(item.get("number", 0))
+                current_citations = []
+            elif item_type == "chapter":
+                save_current_verse()
+                current_chapter = int(item.get("number", 0))
+                current_verse = 0
+                current_citations = []
+            elif item_type == "note":
+                # Footnote - extract citations but don't include note text
+                current_citations.extend(extract_citations_from_note(item))
+            elif item_type == "book":
+                current_book = item.get("code", "")
+            elif content is not None:
+                # Other elements with content - descend
+                stack.append(iter(content))
+                break
+        else:
+            stack.pop()
 
     # Save final verse
     save_current_verse()
@@ -220,7 +280,7 @@ def get_book_code_from_filename(filename: str) -> str:
     Get book code from USJ filename.
     Format: "01GENBSB_full_strongs.usj" -> "GEN"
     """
-    match = re.match(r"^\d{2}([A-Z0-9]+)BSB", filename)
+    match = USJ_FILENAME_PATTERN.match(filename)
     if not match:
         raise ValueError(f"Cannot extract book code from filename: {filename}")
     return match.group(1)
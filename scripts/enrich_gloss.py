@@ -5,12 +5,20 @@ This module provides two functions:
 2. load_strongs_pronunciation() - Transliteration/pronunciation data to merge with UBS
 """
 
-import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from .utils import STRONGS_DIR, extract_strongs_from_words, log
+import orjson
+
+from .utils import STRONGS_DIR, disk_cached, existing_files, extract_strongs_from_words, log
+
+# OpenScriptures Strong's dictionaries (Hebrew, Greek)
+STRONGS_JS_FILES = (
+    STRONGS_DIR / "strongs-hebrew-dictionary.js",
+    STRONGS_DIR / "strongs-greek-dictionary.js",
+)
 
 
 def load_strongs_js_file(path: Path) -> dict[str, dict]:
@@ -18,9 +26,39 @@ def load_strongs_js_file(path: Path) -> dict[str, dict]:
     Load Strong's dictionary from OpenScriptures JS format.
     The file contains: var strongsHebrewDictionary = {...};
     followed by: module.exports = ...
-    """
-    content = path.read_text(encoding="utf-8")
 
+    The parsed dictionary is memoized per file version (mtime and size), so the
+    lexicon and pronunciation loaders share one parse. Callers must not mutate it.
+    """
+    stat = path.stat()
+    return parse_strongs_js_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=len(STRONGS_JS_FILES))
+def parse_strongs_js_file(path: Path, mtime_ns: int, size: int) -> dict[str, dict[str, Any]]:
+    """Parse a Strong's JS dictionary; mtime_ns and size only key the cache."""
+    content = path.read_bytes()
+
+    # Fast path: the object runs from the first "{" after "var ... =" to the
+    # last "};", so plain byte searches find it without decoding the file or
+    # a regex scan, and orjson parses the slice in place
+    var_pos = content.find(b"var ")
+    if var_pos >= 0:
+        json_start = content.find(b"{", content.find(b"=", var_pos))
+        json_end = content.rfind(b"};")
+        if 0 <= json_start < json_end:
+            try:
+                data = orjson.loads(memoryview(content)[json_start : json_end + 1])
+            except orjson.JSONDecodeError:
+                data = None
+            if isinstance(data, dict):
+                return data
+
+    return parse_strongs_js_with_regex(path, content.decode("utf-8"))
+
+
+def parse_strongs_js_with_regex(path: Path, content: str) -> dict[str, dict[str, Any]]:
+    """Locate and parse the dictionary object with regexes (fallback for odd layouts)."""
     # Find where the JSON object starts
     start_match = re.search(r"var\s+\w+\s*=\s*(\{\"[HG]\d+\")", content)
     if not start_match:
@@ -40,12 +78,13 @@ def load_strongs_js_file(path: Path) -> dict[str, dict]:
     json_str = content[json_start : json_start + end_match.start() + 1]
 
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
         log(f"WARNING: JSON decode error in {path}: {e}")
         return {}
 
 
+@disk_cached(lambda: existing_files(*STRONGS_JS_FILES))
 def load_strongs_lexicon() -> dict[str, str]:
     """
     Load Strong's lexicon data from OpenScriptures.
@@ -56,8 +95,7 @@ def load_strongs_lexicon() -> dict[str, str]:
     lexicon: dict[str, str] = {}
 
     # OpenScriptures Strong's dictionary files
-    hebrew_path = STRONGS_DIR / "strongs-hebrew-dictionary.js"
-    greek_path = STRONGS_DIR / "strongs-greek-dictionary.js"
+    hebrew_path, greek_path = STRONGS_JS_FILES
 
     for path in [hebrew_path, greek_path]:
         if not path.exists():
@@ -100,6 +138,7 @@ def load_strongs_lexicon() -> dict[str, str]:
     return lexicon
 
 
+@disk_cached(lambda: existing_files(*STRONGS_JS_FILES))
 def load_strongs_pronunciation() -> dict[str, dict[str, str]]:
     """
     Load transliteration and pronunciation data from OpenScriptures Strong's.
@@ -112,8 +151,7 @@ def load_strongs_pronunciation() -> dict[str, dict[str, str]]:
     """
     pronunciation: dict[str, dict[str, str]] = {}
 
-    hebrew_path = STRONGS_DIR / "strongs-hebrew-dictionary.js"
-    greek_path = STRONGS_DIR / "strongs-greek-dictionary.js"
+    hebrew_path, greek_path = STRONGS_JS_FILES
 
     for path in [hebrew_path, greek_path]:
         if not path.exists():
@@ -152,53 +190,42 @@ def enrich_with_glosses(
     enriched = []
 
     for verse in verses:
-        # Get Strong's numbers from this verse
-        # Try 's' (strongs list in index format) first, then 'w' (words)
-        strongs_nums = verse.get("s", [])
-        if not strongs_nums:
-            words = verse.get("w", [])
-            strongs_nums = extract_strongs_from_words(words)
-
-        # Build glosses dict for this verse
-        glosses: dict[str, str] = {}
-        for s in strongs_nums:
-            if s in lexicon:
-                glosses[s] = lexicon[s]
-
-        enriched_verse = {**verse, "g": glosses}
+        enriched_verse = {**verse}
+        enrich_verse_with_glosses(enriched_verse, lexicon)
         enriched.append(enriched_verse)
 
     return enriched
 
 
+def enrich_verse_with_glosses(verse: dict[str, Any], lexicon: dict[str, str]) -> None:
+    """Add Strong's glosses to a single verse in place."""
+    # Get Strong's numbers from this verse
+    # Try 's' (strongs list in index format) first, then 'w' (words)
+    strongs_nums = verse.get("s") or extract_strongs_from_words(verse.get("w", ()))
+
+    # Build glosses dict for this verse with one lexicon lookup per number
+    verse["g"] = {s: gloss for s in strongs_nums if (gloss := lexicon.get(s)) is not None}
+
+
 def merge_pronunciation_with_ubs(
     ubs_glosses: dict[str, dict],
     pronunciation: dict[str, dict[str, str]],
-) -> dict[str, dict]:
+) -> None:
     """
-    Merge OpenScriptures pronunciation data into UBS gloss entries.
+    Merge OpenScriptures pronunciation data into UBS gloss entries in place.
 
-    Adds 'xlit' and 'pron' fields to each UBS entry where available.
+    Adds 'xlit' and 'pron' fields to each UBS entry where available. The
+    entries are the per-verse dicts built by enrich_ubs, so they are updated
+    directly rather than copied.
 
     Args:
         ubs_glosses: Dict from enrich_ubs (Strong's -> {lemma, glosses, def})
         pronunciation: Dict from load_strongs_pronunciation (Strong's -> {xlit, pron})
-
-    Returns:
-        Merged dict with pronunciation data added to UBS entries
     """
-    merged = {}
-
     for strongs_num, ubs_entry in ubs_glosses.items():
-        merged_entry = {**ubs_entry}
-
-        if strongs_num in pronunciation:
-            pron_data = pronunciation[strongs_num]
+        pron_data = pronunciation.get(strongs_num)
+        if pron_data:
             if "xlit" in pron_data:
-                merged_entry["xlit"] = pron_data["xlit"]
+                ubs_entry["xlit"] = pron_data["xlit"]
             if "pron" in pron_data:
-                merged_entry["pron"] = pron_data["pron"]
-
-        merged[strongs_num] = merged_entry
-
-    return merged
+                ubs_entry["pron"] = pron_data["pron"]
@@ -15,11 +15,13 @@ MARBLE ID format: [type]BBCCCVVVWWWW
 License: CC-BY-SA 4.0 (United Bible Societies)
 """
 
-import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .utils import MARBLE_DIR, log
+import orjson
+
+from .utils import MARBLE_DIR, disk_cached, existing_files, log, worker_count
 
 # Map MARBLE book numbers to our book codes
 MARBLE_BOOK_MAP = {
@@ -64,6 +66,9 @@ MARBLE_BOOK_MAP = {
     39: "MAL",
 }
 
+# MARBLE book numbers are dense (1-39), so parse_marble_id indexes a tuple
+MARBLE_BOOK_CODES: tuple[str | None, ...] = (None, *(MARBLE_BOOK_MAP[n] for n in range(1, 40)))
+
 # Book codes used in MARBLE filenames
 MARBLE_BOOK_FILES = [
     "GEN",
@@ -130,7 +135,7 @@ def parse_marble_id(marble_id: str) -> tuple[str, int, int, int] | None:
         verse = int(marble_id[6:9])
         word_pos = int(marble_id[9:13])
 
-        book_code = MARBLE_BOOK_MAP.get(book_num)
+        book_code = MARBLE_BOOK_CODES[book_num] if 1 <= book_num <= 39 else None
         if not book_code:
             return None
 
@@ -139,6 +144,79 @@ def parse_marble_id(marble_id: str) -> tuple[str, int, int, int] | None:
         return None
 
 
+def _load_marble_book(file_path: Path) -> tuple[dict[str, dict[str, Any]], int]:
+    """Index one MARBLE file's links by verse ID.
+
+    Runs in a worker process. Image and map links are collected as dict keys
+    (an insertion-ordered set) for deduplication. Returns (book index,
+    entries processed).
+    """
+    book_index: dict[str, dict[str, Any]] = {}
+    entries_processed = 0
+
+    data = orjson.loads(file_path.read_bytes())
+
+    for entry in data:
+        marble_id = entry.get("ID")
+        if not marble_id:
+            continue
+
+        parsed = parse_marble_id(marble_id)
+        if not parsed:
+            continue
+
+        book, chapter, verse, word_pos = parsed
+        verse_id = f"{book}.{chapter}.{verse}"
+
+        # Extract relevant links
+        image_links = entry.get("ImageLinks", [])
+        map_links = entry.get("MapLinks", [])
+        lexical_links = entry.get("LexicalLinks", [])
+
+        # Skip entries with no useful data
+        if not (image_links or map_links or lexical_links):
+            continue
+
+        entries_processed += 1
+
+        if verse_id not in book_index:
+            book_index[verse_id] = {}
+
+        verse_data = book_index[verse_id]
+
+        # Add image and map links (verse-level, deduplicated). They are
+        # collected as dict keys, an insertion-ordered set, and turned
+        # into lists once all files are read.
+        if image_links:
+            verse_data.setdefault("img", {}).update(dict.fromkeys(filter(None, image_links)))
+        if map_links:
+            verse_data.setdefault("map", {}).update(dict.fromkeys(filter(None, map_links)))
+
+        # Add sense data from LexicalLinks (word-level)
+        # Format: "SDBH:lemma:senseId:domain"
+        if lexical_links:
+            if "sense" not in verse_data:
+                verse_data["sense"] = {}
+
+            for link in lexical_links:
+                parts = link.split(":")
+                if len(parts) >= 4 and parts[0] == "SDBH":
+                    lemma = parts[1]
+                    sense_id = parts[2]
+                    domain = parts[3]
+
+                    verse_data["sense"][str(word_pos)] = {
+                        "lem": lemma,
+                        "dom": domain,
+                        "sid": sense_id,
+                    }
+
+    return book_index, entries_processed
+
+
+@disk_cached(
+    lambda: existing_files(*(MARBLE_DIR / f"MARBLELinks-{code}.json" for code in MARBLE_BOOK_FILES))
+)
 def build_marble_index() -> dict[str, dict[str, Any]]:
     """
     Build an index mapping verse IDs to image and map links.
@@ -163,81 +241,38 @@ def build_marble_index() -> dict[str, dict[str, Any]]:
     files_processed = 0
     entries_processed = 0
 
-    for book_code in MARBLE_BOOK_FILES:
-        file_path = MARBLE_DIR / f"MARBLELinks-{book_code}.json"
-        if not file_path.exists():
-            continue
-
-        try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as e:
-            log(f"WARNING: Failed to load {file_path.name}: {e}")
-            continue
-
-        files_processed += 1
-
-        for entry in data:
-            marble_id = entry.get("ID")
-            if not marble_id:
-                continue
-
-            parsed = parse_marble_id(marble_id)
-            if not parsed:
+    # Files are independent, so each is parsed in its own worker and the
+    # results are merged in book order
+    with ProcessPoolExecutor(max_workers=worker_count()) as executor:
+        futures = {}
+        for book_code in MARBLE_BOOK_FILES:
+            file_path = MARBLE_DIR / f"MARBLELinks-{book_code}.json"
+            if file_path.exists():
+                futures[file_path] = executor.submit(_load_marble_book, file_path)
+
+        for file_path, future in futures.items():
+            try:
+                book_index, book_entries = future.result()
+            except (orjson.JSONDecodeError, OSError) as e:
+                log(f"WARNING: Failed to load {file_path.name}: {e}")
                 continue
 
-            book, chapter, verse, word_pos = parsed
-            verse_id = f"{book}.{chapter}.{verse}"
-
-            # Extract relevant links
-            image_links = entry.get("ImageLinks", [])
-            map_links = entry.get("MapLinks", [])
-            lexical_links = entry.get("LexicalLinks", [])
+            files_processed += 1
+            entries_processed += book_entries
 
-            # Skip entries with no useful data
-            if not (image_links or map_links or lexical_links):
-                continue
+            for verse_id, book_data in book_index.items():
+                verse_data = marble_index.get(verse_id)
+                if verse_data is None:
+                    marble_index[verse_id] = book_data
+                else:
+                    # A verse linked from more than one file: merge in file order
+                    for key, values in book_data.items():
+                        verse_data.setdefault(key, {}).update(values)
 
-            entries_processed += 1
-
-            if verse_id not in marble_index:
-                marble_index[verse_id] = {}
-
-            verse_data = marble_index[verse_id]
-
-            # Add image links (verse-level, deduplicated)
-            if image_links:
-                if "img" not in verse_data:
-                    verse_data["img"] = []
-                for img in image_links:
-                    if img and img not in verse_data["img"]:
-                        verse_data["img"].append(img)
-
-            # Add map links (verse-level, deduplicated)
-            if map_links:
-                if "map" not in verse_data:
-                    verse_data["map"] = []
-                for coords in map_links:
-                    if coords and coords not in verse_data["map"]:
-                        verse_data["map"].append(coords)
-
-            # Add sense data from LexicalLinks (word-level)
-            # Format: "SDBH:lemma:senseId:domain"
-            if lexical_links:
-                if "sense" not in verse_data:
-                    verse_data["sense"] = {}
-
-                for link in lexical_links:
-                    parts = link.split(":")
-                    if len(parts) >= 4 and parts[0] == "SDBH":
-                        lemma = parts[1]
-                        sense_id = parts[2]
-                        domain = parts[3]
-
-                        verse_data["sense"][str(word_pos)] = {
-                            "lem": lemma,
-                            "dom": domain,
-                            "sid": sense_id,
-                        }
+    for verse_data in marble_index.values():
+        for key in ("img", "map"):
+            if key in verse_data:
+                verse_data[key] = list(verse_data[key])
 
     log(f"  Processed {files_processed} MARBLE files, {entries_processed} entries")
     log(f"  Verses with media links: {len(marble_index)}")
@@ -269,25 +304,31 @@ def enrich_with_marble(
     sense_added = 0
 
     for verse in verses:
-        verse_id = verse.get("id")
         enriched_verse = {**verse}
+        enrich_verse_with_marble(enriched_verse, marble_index)
+        img_added += "img" in enriched_verse
+        map_added += "map" in enriched_verse
+        sense_added += "msense" in enriched_verse
+        enriched.append(enriched_verse)
+
+    log(f"  Added images to {img_added}, maps to {map_added}, sense to {sense_added} verses")
+    return enriched
 
-        if verse_id and verse_id in marble_index:
-            marble_data = marble_index[verse_id]
 
-            if marble_data.get("img"):
-                enriched_verse["img"] = marble_data["img"]
-                img_added += 1
+def enrich_verse_with_marble(
+    verse: dict[str, Any], marble_index: dict[str, dict[str, Any]]
+) -> None:
+    """Add MARBLE 'img', 'map' and 'msense' fields to a single verse in place."""
+    verse_id = verse.get("id")
 
-            if marble_data.get("map"):
-                enriched_verse["map"] = marble_data["map"]
-                map_added += 1
+    if verse_id and verse_id in marble_index:
+        marble_data = marble_index[verse_id]
 
-            if marble_data.get("sense"):
-                enriched_verse["msense"] = marble_data["sense"]
-                sense_added += 1
+        if marble_data.get("img"):
+            verse["img"] = marble_data["img"]
 
-        enriched.append(enriched_verse)
+        if marble_data.get("map"):
+            verse["map"] = marble_data["map"]
 
-    log(f"  Added images to {img_added}, maps to {map_added}, sense to {sense_added} verses")
-    return enriched
+        if marble_data.get("sense"):
+            verse["msense"] = marble_data["sense"]
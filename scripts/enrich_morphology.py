@@ -2,11 +2,13 @@
 
 import re
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from .types import BOOK_CODES, MorphologyEntry
-from .utils import OSHB_DIR, log, verse_id
+from .types import MorphologyEntry
+from .utils import OSHB_DIR, disk_cached, existing_files, log, verse_id, worker_count
 
 # OSHB book filename mapping (different from BSB codes)
 OSHB_BOOK_FILES: dict[str, str] = {
@@ -51,6 +53,10 @@ OSHB_BOOK_FILES: dict[str, str] = {
     "MAL": "Mal.xml",
 }
 
+OSIS_NAMESPACE = "http://www.bibletechnologies.net/2003/OSIS/namespace"
+OSIS_NS = {"osis": OSIS_NAMESPACE}
+OSIS_VERSE_TAG = f"{{{OSIS_NAMESPACE}}}verse"
+
 # Morphology code to part of speech mapping
 MORPH_POS: dict[str, str] = {
     "A": "adjective",
@@ -65,8 +71,16 @@ MORPH_POS: dict[str, str] = {
 }
 
 
+# Leading number of an OSHB lemma part ("7225", "1254 a")
+LEMMA_NUMBER_PATTERN = re.compile(r"(\d+)")
+
+
+@lru_cache(maxsize=None)
 def parse_morph_code(morph: str) -> str:
-    """Extract part of speech from morphology code."""
+    """Extract part of speech from morphology code.
+
+    Cached: morphology codes repeat heavily across the Old Testament.
+    """
     if not morph:
         return ""
 
@@ -84,6 +98,79 @@ def parse_morph_code(morph: str) -> str:
     return ""
 
 
+@lru_cache(maxsize=None)
+def lemma_to_strongs(lemma: str) -> str:
+    """Parse an OSHB lemma to a Strong's number, or "" if it has none.
+
+    Format: "b/7225", "7225", or "1254 a" -> "H7225", "H1254"
+    (OSHB uses "number + letter" format for some lemmas).
+    Cached: the same lemmas recur thousands of times.
+    """
+    for part in lemma.split("/"):
+        # Extract numeric portion (handles "1254 a" format)
+        num_match = LEMMA_NUMBER_PATTERN.match(part)
+        if num_match:
+            return f"H{int(num_match.group(1))}"
+    return ""
+
+
+def parse_oshb_verse(
+    book_code: str, verse_elem: ET.Element
+) -> tuple[str, list[MorphologyEntry]] | None:
+    """Return (verse ID, morphology entries) for an OSIS verse, or None if it has none."""
+    # Get verse reference (e.g., "Gen.1.1")
+    osis_id = verse_elem.get("osisID", "")
+    if not osis_id:
+        return None
+
+    # Parse OSIS ID to our format
+    try:
+        parts = osis_id.split(".")
+        chapter = int(parts[1])
+        verse_num = int(parts[2])
+        vid = verse_id(book_code, chapter, verse_num)
+    except (IndexError, ValueError):
+        return None
+
+    # Find all words with morphology
+    entries: list[MorphologyEntry] = []
+    for word_elem in verse_elem.findall(".//osis:w", OSIS_NS):
+        lemma = word_elem.get("lemma", "")
+        morph = word_elem.get("morph", "")
+        text = word_elem.text or ""
+
+        if lemma and morph:
+            strongs_num = lemma_to_strongs(lemma)
+            if strongs_num:
+                entry: MorphologyEntry = {
+                    "s": strongs_num,
+                    "m": morph,
+                    "p": parse_morph_code(morph),
+                    "l": text.strip(),
+                }
+                entries.append(entry)
+
+    return (vid, entries) if entries else None
+
+
+def _load_oshb_book(book_code: str, xml_path: Path) -> dict[str, list[MorphologyEntry]]:
+    """Load one OSHB book's morphology by verse ID.
+
+    Runs in a worker process. Verses are streamed and cleared once processed,
+    so only one verse's words are in memory rather than the whole book.
+    Raises ET.ParseError if the file is malformed.
+    """
+    book_morphology: dict[str, list[MorphologyEntry]] = {}
+    for _, elem in ET.iterparse(xml_path):
+        if elem.tag == OSIS_VERSE_TAG:
+            parsed = parse_oshb_verse(book_code, elem)
+            if parsed:
+                book_morphology[parsed[0]] = parsed[1]
+            elem.clear()
+    return book_morphology
+
+
+@disk_cached(lambda: existing_files(*(OSHB_DIR / name for name in OSHB_BOOK_FILES.values())))
 def load_oshb_morphology() -> dict[str, list[MorphologyEntry]]:
     """
     Load OSHB morphology data for Old Testament.
@@ -96,72 +183,23 @@ def load_oshb_morphology() -> dict[str, list[MorphologyEntry]]:
     morphology: dict[str, list[MorphologyEntry]] = {}
     files_processed = 0
 
-    # XML namespace
-    ns = {"osis": "http://www.bibletechnologies.net/2003/OSIS/namespace"}
-
-    for book_code, filename in OSHB_BOOK_FILES.items():
-        xml_path = OSHB_DIR / filename
-        if not xml_path.exists():
-            continue
-
-        try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
-            # Find all verses
-            for verse_elem in root.findall(".//osis:verse", ns):
-                # Get verse reference (e.g., "Gen.1.1")
-                osis_id = verse_elem.get("osisID", "")
-                if not osis_id:
-                    continue
-
-                # Parse OSIS ID to our format
-                try:
-                    parts = osis_id.split(".")
-                    chapter = int(parts[1])
-                    verse_num = int(parts[2])
-                    vid = verse_id(book_code, chapter, verse_num)
-                except (IndexError, ValueError):
-                    continue
-
-                # Find all words with morphology
-                entries: list[MorphologyEntry] = []
-                for word_elem in verse_elem.findall(".//osis:w", ns):
-                    lemma = word_elem.get("lemma", "")
-                    morph = word_elem.get("morph", "")
-                    text = word_elem.text or ""
-
-                    if lemma and morph:
-                        # Parse lemma to Strong's number
-                        # Format: "b/7225", "7225", or "1254 a" -> "H7225", "H1254"
-                        # OSHB uses "number + letter" format for some lemmas
-                        lemma_parts = lemma.split("/")
-                        strongs_num = ""
-                        for part in lemma_parts:
-                            # Extract numeric portion (handles "1254 a" format)
-                            num_match = re.match(r"(\d+)", part)
-                            if num_match:
-                                strongs_num = f"H{int(num_match.group(1))}"
-                                break
-
-                        if strongs_num:
-                            entry: MorphologyEntry = {
-                                "s": strongs_num,
-                                "m": morph,
-                                "p": parse_morph_code(morph),
-                                "l": text.strip(),
-                            }
-                            entries.append(entry)
-
-                if entries:
-                    morphology[vid] = entries
-
+    # Books are independent, so each is parsed in its own worker and the
+    # results are merged in book order
+    with ProcessPoolExecutor(max_workers=worker_count()) as executor:
+        futures = {}
+        for book_code, filename in OSHB_BOOK_FILES.items():
+            xml_path = OSHB_DIR / filename
+            if xml_path.exists():
+                futures[xml_path] = executor.submit(_load_oshb_book, book_code, xml_path)
+
+        for xml_path, future in futures.items():
+            try:
+                morphology.update(future.result())
+            except ET.ParseError as e:
+                log(f"WARNING: Error parsing {xml_path}: {e}")
+                continue
             files_processed += 1
 
-        except ET.ParseError as e:
-            log(f"WARNING: Error parsing {xml_path}: {e}")
-            continue
-
     log(f"Loaded morphology from {files_processed} OSHB files")
     log(f"Verses with morphology: {len(morphology)}")
 
@@ -175,10 +213,17 @@ def enrich_with_morphology(
     enriched = []
 
     for verse in verses:
-        vid = verse_id(verse["b"], verse["c"], verse["v"])
-        verse_morph = morphology.get(vid, [])
-
-        enriched_verse = {**verse, "m": verse_morph}
+        enriched_verse = {**verse}
+        enrich_verse_with_morphology(enriched_verse, morphology)
         enriched.append(enriched_verse)
 
     return enriched
+
+
+def enrich_verse_with_morphology(
+    verse: dict[str, Any], morphology: dict[str, list[MorphologyEntry]]
+) -> None:
+    """Add morphology data to a single verse in place."""
+    # Index verses already carry their id; display verses only have b/c/v
+    vid = verse.get("id") or verse_id(verse["b"], verse["c"], verse["v"])
+    verse["m"] = morphology.get(vid, [])
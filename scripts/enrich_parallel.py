@@ -19,10 +19,9 @@ License: CC-BY-SA 4.0 (United Bible Societies)
 
 import re
 import xml.etree.ElementTree as ET
-from pathlib import Path
 from typing import Any
 
-from .utils import SOURCES_DIR, log
+from .utils import SOURCES_DIR, disk_cached, existing_files, log
 
 UBS_DIR = SOURCES_DIR / "ubs-dictionaries"
 
@@ -49,6 +48,44 @@ def parse_verse_ref(ref: str) -> list[tuple[str, int, int]]:
     return [(book, chapter, v) for v in range(start_verse, end_verse + 1)]
 
 
+def add_passage_refs(passage: ET.Element, parallel_refs: dict[str, dict[str, str]]) -> int:
+    """Record the parallels between the verses of one <Passage>.
+
+    Returns 1 if the passage was counted (it has at least two verses), else 0.
+    """
+    verses = passage.findall("Verse")
+    if len(verses) < 2:
+        return 0
+
+    # Collect all verse refs in this passage group
+    verse_refs: list[tuple[str, str]] = []  # (verse_id, type)
+
+    for verse_elem in verses:
+        ref_text = verse_elem.text
+        if not ref_text:
+            continue
+
+        # Determine type (Hebrew or Greek)
+        verse_type = "HEB" if verse_elem.get("HEB") else "GRK"
+
+        # Parse the reference
+        parsed = parse_verse_ref(ref_text)
+        for book, chapter, verse in parsed:
+            verse_id = f"{book}.{chapter}.{verse}"
+            verse_refs.append((verse_id, verse_type))
+
+    # Create cross-references between all verses in the passage
+    for i, (verse_id, _) in enumerate(verse_refs):
+        refs = parallel_refs.setdefault(verse_id, {})
+        for j, (other_id, other_type) in enumerate(verse_refs):
+            # Keep the first type recorded for each parallel
+            if i != j and other_id not in refs:
+                refs[other_id] = other_type
+
+    return 1
+
+
+@disk_cached(lambda: existing_files(UBS_DIR / "ParallelPassages.xml"))
 def build_parallel_index() -> dict[str, list[dict[str, Any]]]:
     """
     Build an index mapping verse IDs to their parallel passages.
@@ -70,55 +107,24 @@ def build_parallel_index() -> dict[str, list[dict[str, Any]]]:
 
     log(f"Loading parallel passages from {xml_path.name}")
 
+    passages_count = 0
+    # Per verse: other verse ID -> type, in first-seen order (O(1) duplicate checks)
+    parallel_refs: dict[str, dict[str, str]] = {}
+
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        # Stream passages, clearing each once read
+        for _, passage in ET.iterparse(xml_path):
+            if passage.tag == "Passage":
+                passages_count += add_passage_refs(passage, parallel_refs)
+                passage.clear()
     except ET.ParseError as e:
         log(f"WARNING: Failed to parse Parallel Passages XML: {e}")
         return parallel_index
 
-    passages_count = 0
-
-    for passage in root.findall("Passage"):
-        verses = passage.findall("Verse")
-        if len(verses) < 2:
-            continue
-
-        passages_count += 1
-
-        # Collect all verse refs in this passage group
-        verse_refs: list[tuple[str, str]] = []  # (verse_id, type)
-
-        for verse_elem in verses:
-            ref_text = verse_elem.text
-            if not ref_text:
-                continue
-
-            # Determine type (Hebrew or Greek)
-            verse_type = "HEB" if verse_elem.get("HEB") else "GRK"
-
-            # Parse the reference
-            parsed = parse_verse_ref(ref_text)
-            for book, chapter, verse in parsed:
-                verse_id = f"{book}.{chapter}.{verse}"
-                verse_refs.append((verse_id, verse_type))
-
-        # Create cross-references between all verses in the passage
-        for i, (verse_id, _) in enumerate(verse_refs):
-            if verse_id not in parallel_index:
-                parallel_index[verse_id] = []
-
-            for j, (other_id, other_type) in enumerate(verse_refs):
-                if i != j:
-                    # Check if this parallel is already recorded
-                    existing = [p for p in parallel_index[verse_id] if p["ref"] == other_id]
-                    if not existing:
-                        parallel_index[verse_id].append(
-                            {
-                                "ref": other_id,
-                                "type": other_type,
-                            }
-                        )
+    for verse_id, refs in parallel_refs.items():
+        parallel_index[verse_id] = [
+            {"ref": other_id, "type": other_type} for other_id, other_type in refs.items()
+        ]
 
     log(f"  Processed {passages_count} parallel passage groups")
     log(f"  Verses with parallel refs: {len(parallel_index)}")
@@ -149,17 +155,26 @@ def enrich_with_parallels(
     enriched_count = 0
 
     for verse in verses:
-        verse_id = verse.get("id")
         enriched_verse = {**verse}
-
-        if verse_id and verse_id in parallel_index:
-            parallels = parallel_index[verse_id]
-            if parallels:
-                # Simplify to just reference list for compact output
-                enriched_verse["par"] = [p["ref"] for p in parallels]
-                enriched_count += 1
-
+        if enrich_verse_with_parallels(enriched_verse, parallel_index):
+            enriched_count += 1
         enriched.append(enriched_verse)
 
     log(f"  Added parallel refs to {enriched_count} verses")
     return enriched
+
+
+def enrich_verse_with_parallels(
+    verse: dict[str, Any], parallel_index: dict[str, list[dict[str, Any]]]
+) -> bool:
+    """Add the 'par' field to a single verse in place; return True if it was added."""
+    verse_id = verse.get("id")
+
+    if verse_id and verse_id in parallel_index:
+        parallels = parallel_index[verse_id]
+        if parallels:
+            # Simplify to just reference list for compact output
+            verse["par"] = [p["ref"] for p in parallels]
+            return True
+
+    return False
@@ -5,7 +5,7 @@ import xml.etree.ElementTree as ET
 from typing import Any
 
 from .types import BOOK_NUMBERS
-from .utils import NAVES_DIR, log, verse_id
+from .utils import NAVES_DIR, disk_cached, existing_files, log, verse_id
 
 # Mapping from CCEL/OSIS book abbreviations to our book codes
 OSIS_TO_BOOK_CODE = {
@@ -130,6 +130,7 @@ def parse_single_osis_ref(ref: str) -> tuple[str, int, int] | None:
     return None
 
 
+@disk_cached(lambda: existing_files(NAVES_DIR / "naves-topical-bible.xml"))
 def load_topics() -> dict[str, list[str]]:
     """
     Load Nave's Topical Bible data from CCEL ThML XML.
@@ -145,38 +146,39 @@ def load_topics() -> dict[str, list[str]]:
 
     log(f"Loading topics from {naves_path.name}")
 
-    # Parse XML
-    try:
-        tree = ET.parse(naves_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        log(f"WARNING: Could not parse Nave's XML: {e}")
-        return {}
-
     topics: dict[str, list[str]] = {}
     current_topic = None
     topic_count = 0
 
-    # Find all term and scripRef elements
+    # Stream term and scripRef elements, clearing each topic's term and def
+    # once read so the parsed tree never holds the whole file
     # ThML structure: <glossary><term>TOPIC</term><def>...<scripRef>...</scripRef>...</def></glossary>
-    for elem in root.iter():
-        if elem.tag == "term":
-            current_topic = elem.text
-            if current_topic:
-                current_topic = current_topic.strip()
-                topic_count += 1
-
-        elif elem.tag == "scripRef" and current_topic:
-            # Get OSIS reference from osisRef attribute
-            osis_ref = elem.get("osisRef", "")
-            if osis_ref:
-                refs = parse_osis_ref(osis_ref)
-                for book, chapter, verse in refs:
-                    vid = verse_id(book, chapter, verse)
-                    if vid not in topics:
-                        topics[vid] = []
-                    if current_topic not in topics[vid]:
-                        topics[vid].append(current_topic)
+    try:
+        for _, elem in ET.iterparse(naves_path):
+            if elem.tag == "term":
+                current_topic = elem.text
+                if current_topic:
+                    current_topic = current_topic.strip()
+                    topic_count += 1
+                elem.clear()
+
+            elif elem.tag == "scripRef" and current_topic:
+                # Get OSIS reference from osisRef attribute
+                osis_ref = elem.get("osisRef", "")
+                if osis_ref:
+                    refs = parse_osis_ref(osis_ref)
+                    for book, chapter, verse in refs:
+                        vid = verse_id(book, chapter, verse)
+                        if vid not in topics:
+                            topics[vid] = []
+                        if current_topic not in topics[vid]:
+                            topics[vid].append(current_topic)
+
+            elif elem.tag == "def":
+                elem.clear()
+    except ET.ParseError as e:
+        log(f"WARNING: Could not parse Nave's XML: {e}")
+        return {}
 
     if topics:
         log(f"Loaded {len(topics)} verses with topics from {topic_count} topics")
@@ -195,10 +197,15 @@ def enrich_with_topics(
     enriched = []
 
     for verse in verses:
-        vid = verse_id(verse["b"], verse["c"], verse["v"])
-        verse_topics = topics.get(vid, [])
-
-        enriched_verse = {**verse, "tp": verse_topics}
+        enriched_verse = {**verse}
+        enrich_verse_with_topics(enriched_verse, topics)
         enriched.append(enriched_verse)
 
     return enriched
+
+
+def enrich_verse_with_topics(verse: dict[str, Any], topics: dict[str, list[str]]) -> None:
+    """Add topics to a single verse in place."""
+    # Index verses already carry their id; display verses only have b/c/v
+    vid = verse.get("id") or verse_id(verse["b"], verse["c"], verse["v"])
+    verse["tp"] = topics.get(vid, [])
@@ -10,11 +10,11 @@ providing richer lexical data than the basic Strong's definitions:
 License: CC-BY-SA 4.0 (United Bible Societies)
 """
 
-import json
-from pathlib import Path
 from typing import Any
 
-from .utils import SOURCES_DIR, log
+import orjson
+
+from .utils import SOURCES_DIR, disk_cached, existing_files, log
 
 UBS_DIR = SOURCES_DIR / "ubs-dictionaries"
 
@@ -121,8 +121,8 @@ def load_ubs_hebrew() -> dict[str, dict]:
     log(f"Loading UBS Hebrew dictionary from {path.name}")
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
+        data = orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError as e:
         log(f"WARNING: Failed to parse UBS Hebrew dictionary: {e}")
         return {}
 
@@ -155,8 +155,8 @@ def load_ubs_greek() -> dict[str, dict]:
     log(f"Loading UBS Greek dictionary from {path.name}")
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
+        data = orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError as e:
         log(f"WARNING: Failed to parse UBS Greek dictionary: {e}")
         return {}
 
@@ -174,6 +174,9 @@ def load_ubs_greek() -> dict[str, dict]:
     return lexicon
 
 
+@disk_cached(
+    lambda: existing_files(UBS_DIR / "UBSHebrewDic-en.json", UBS_DIR / "UBSGreekNTDic-en.json")
+)
 def load_ubs_lexicon() -> dict[str, dict]:
     """
     Load both Hebrew and Greek UBS dictionaries.
@@ -213,44 +216,47 @@ def enrich_with_ubs(
     enriched = []
 
     for verse in verses:
-        strongs_nums = verse.get("s", [])
+        enriched_verse = {**verse}
+        enrich_verse_with_ubs(enriched_verse, ubs_lexicon)
+        enriched.append(enriched_verse)
+
+    return enriched
 
-        # Build UBS gloss data for this verse
-        glosses: dict[str, dict] = {}
-        verse_domains: set[str] = set()
 
-        for s in strongs_nums:
-            if s in ubs_lexicon:
-                entry = ubs_lexicon[s]
+def enrich_verse_with_ubs(verse: dict[str, Any], ubs_lexicon: dict[str, dict]) -> None:
+    """Add UBS lexicon data ('g' and 'dom') to a single verse in place."""
+    strongs_nums = verse.get("s", [])
 
-                # Build compact gloss entry
-                gloss_entry: dict[str, Any] = {}
+    # Build UBS gloss data for this verse
+    glosses: dict[str, dict] = {}
+    verse_domains: set[str] = set()
 
-                if entry.get("lemma"):
-                    gloss_entry["lemma"] = entry["lemma"]
+    for s in strongs_nums:
+        if s in ubs_lexicon:
+            entry = ubs_lexicon[s]
 
-                # Use first sense's glosses and definition
-                if entry.get("senses"):
-                    first_sense = entry["senses"][0]
-                    if first_sense.get("glosses"):
-                        gloss_entry["glosses"] = first_sense["glosses"]
-                    if first_sense.get("def"):
-                        gloss_entry["def"] = first_sense["def"]
+            # Build compact gloss entry
+            gloss_entry: dict[str, Any] = {}
 
-                if gloss_entry:
-                    glosses[s] = gloss_entry
+            if entry.get("lemma"):
+                gloss_entry["lemma"] = entry["lemma"]
 
-                # Collect core domains for verse-level tagging
-                verse_domains.update(entry.get("core_domains", []))
+            # Use first sense's glosses and definition
+            if entry.get("senses"):
+                first_sense = entry["senses"][0]
+                if first_sense.get("glosses"):
+                    gloss_entry["glosses"] = first_sense["glosses"]
+                if first_sense.get("def"):
+                    gloss_entry["def"] = first_sense["def"]
 
-        # Build enriched verse
-        enriched_verse = {**verse}
-        enriched_verse["g"] = glosses
+            if gloss_entry:
+                glosses[s] = gloss_entry
 
-        # Add semantic domains if any
-        if verse_domains:
-            enriched_verse["dom"] = sorted(verse_domains)
+            # Collect core domains for verse-level tagging
+            verse_domains.update(entry.get("core_domains", []))
 
-        enriched.append(enriched_verse)
+    verse["g"] = glosses
 
-    return enriched
+    # Add semantic domains if any
+    if verse_domains:
+        verse["dom"] = sorted(verse_domains)
@@ -13,11 +13,11 @@ UBS Reference format: BBB CCC VVV WWWWW (14 digits)
 License: CC-BY-SA 4.0 (United Bible Societies)
 """
 
-import json
-from pathlib import Path
 from typing import Any
 
-from .utils import SOURCES_DIR, log
+import orjson
+
+from .utils import SOURCES_DIR, disk_cached, existing_files, log
 
 UBS_DIR = SOURCES_DIR / "ubs-dictionaries"
 
@@ -191,6 +191,9 @@ def build_sense_index(ubs_data: list[dict]) -> dict[str, dict[str, Any]]:
     return sense_index
 
 
+@disk_cached(
+    lambda: existing_files(UBS_DIR / "UBSHebrewDic-en.json", UBS_DIR / "UBSGreekNTDic-en.json")
+)
 def load_ubs_sense_index() -> dict[str, dict[str, Any]]:
     """
     Load UBS dictionaries and build combined sense index.
@@ -206,7 +209,7 @@ def load_ubs_sense_index() -> dict[str, dict[str, Any]]:
     if hebrew_path.exists():
         log(f"Building sense index from {hebrew_path.name}")
         try:
-            hebrew_data = json.loads(hebrew_path.read_text(encoding="utf-8"))
+            hebrew_data = orjson.loads(hebrew_path.read_bytes())
             hebrew_index = build_sense_index(hebrew_data)
             log(f"  Hebrew: {len(hebrew_index)} verses with sense data")
 
@@ -215,7 +218,7 @@ def load_ubs_sense_index() -> dict[str, dict[str, Any]]:
                 if verse_id not in combined_index:
                     combined_index[verse_id] = {"wp": {}}
                 combined_index[verse_id]["wp"].update(data["wp"])
-        except (json.JSONDecodeError, OSError) as e:
+        except (orjson.JSONDecodeError, OSError) as e:
             log(f"WARNING: Failed to load Hebrew dictionary: {e}")
     else:
         log(f"WARNING: Hebrew dictionary not found at {hebrew_path}")
@@ -224,7 +227,7 @@ def load_ubs_sense_index() -> dict[str, dict[str, Any]]:
     if greek_path.exists():
         log(f"Building sense index from {greek_path.name}")
         try:
-            greek_data = json.loads(greek_path.read_text(encoding="utf-8"))
+            greek_data = orjson.loads(greek_path.read_bytes())
             greek_index = build_sense_index(greek_data)
             log(f"  Greek: {len(greek_index)} verses with sense data")
 
@@ -233,7 +236,7 @@ def load_ubs_sense_index() -> dict[str, dict[str, Any]]:
                 if verse_id not in combined_index:
                     combined_index[verse_id] = {"wp": {}}
                 combined_index[verse_id]["wp"].update(data["wp"])
-        except (json.JSONDecodeError, OSError) as e:
+        except (orjson.JSONDecodeError, OSError) as e:
             log(f"WARNING: Failed to load Greek dictionary: {e}")
     else:
         log(f"WARNING: Greek dictionary not found at {greek_path}")
@@ -266,17 +269,26 @@ def enrich_with_sense_data(
     enriched_count = 0
 
     for verse in verses:
-        verse_id = verse.get("id")
         enriched_verse = {**verse}
-
-        if verse_id and verse_id in sense_index:
-            sense_data = sense_index[verse_id]
-            if sense_data.get("wp"):
-                # Convert int keys to string for JSON compatibility
-                enriched_verse["ws"] = {str(k): v for k, v in sense_data["wp"].items()}
-                enriched_count += 1
-
+        if enrich_verse_with_sense_data(enriched_verse, sense_index):
+            enriched_count += 1
         enriched.append(enriched_verse)
 
     log(f"  Added sense data to {enriched_count} verses")
     return enriched
+
+
+def enrich_verse_with_sense_data(
+    verse: dict[str, Any], sense_index: dict[str, dict[str, Any]]
+) -> bool:
+    """Add the 'ws' field to a single verse in place; return True if it was added."""
+    verse_id = verse.get("id")
+
+    if verse_id and verse_id in sense_index:
+        sense_data = sense_index[verse_id]
+        if sense_data.get("wp"):
+            # Convert int keys to string for JSON compatibility
+            verse["ws"] = {str(k): v for k, v in sense_data["wp"].items()}
+            return True
+
+    return False
@@ -2,8 +2,7 @@
 
 from typing import Any
 
-from .types import BOOK_CODES
-from .utils import BIBLE_DB_DIR, log, read_json, verse_id
+from .utils import BIBLE_DB_DIR, disk_cached, log, read_json, verse_id
 
 # Map book names to codes
 BOOK_NAME_TO_CODE: dict[str, str] = {
@@ -81,6 +80,7 @@ def book_name_to_code(name: str) -> str | None:
     return BOOK_NAME_TO_CODE.get(name)
 
 
+@disk_cached(lambda: sorted((BIBLE_DB_DIR / "sources" / "extras").glob("cross_references_*.json")))
 def load_cross_references() -> dict[str, list[str]]:
     """
     Load cross-references from scrollmapper bible_databases.
@@ -167,10 +167,15 @@ def enrich_with_xrefs(
     enriched = []
 
     for verse in verses:
-        vid = verse_id(verse["b"], verse["c"], verse["v"])
-        verse_xrefs = xrefs.get(vid, [])
-
-        enriched_verse = {**verse, "x": verse_xrefs}
+        enriched_verse = {**verse}
+        enrich_verse_with_xrefs(enriched_verse, xrefs)
         enriched.append(enriched_verse)
 
     return enriched
+
+
+def enrich_verse_with_xrefs(verse: dict[str, Any], xrefs: dict[str, list[str]]) -> None:
+    """Add cross-references to a single verse in place."""
+    # Index verses already carry their id; display verses only have b/c/v
+    vid = verse.get("id") or verse_id(verse["b"], verse["c"], verse["v"])
+    verse["x"] = xrefs.get(vid, [])
@@ -4,10 +4,9 @@
 import json
 import urllib.request
 from datetime import datetime, timezone
-from pathlib import Path
 
 from .schemas import get_all_schemas
-from .utils import OUTPUT_DIR, SCHEMA_DIR, SOURCES_DIR, ensure_dir, log, write_json
+from .utils import OUTPUT_DIR, SCHEMA_DIR, ensure_dir, log, write_json
 
 # GitHub repo info for source data
 SOURCE_REPOS = {
@@ -0,0 +1,101 @@
+"""Parsed USJ book cache shared by the PD and CC-BY index builders.
+
+Both index builders need the same plain text, Strong's list and word counts
+for every verse, so each book is parsed once and kept under .cache/parsed/
+until its USJ source or the parsing code changes.
+"""
+
+import hashlib
+import pickle
+from functools import lru_cache
+from pathlib import Path
+
+from .convert_usj import parse_usj_bytes
+from .types import ParsedVerse
+from .utils import (
+    CACHE_DIR,
+    ensure_dir,
+    file_digest,
+    load_pickle,
+    strongs_from_tags,
+    write_bytes_atomic,
+)
+
+PARSED_CACHE_DIR = CACHE_DIR / "parsed"
+
+# Source files whose changes must invalidate the parsed book cache
+_SCRIPTS_DIR = Path(__file__).parent
+PARSE_CODE_FILES = [
+    _SCRIPTS_DIR / name for name in ("convert_usj.py", "parse_cache.py", "types.py", "utils.py")
+]
+
+
+@lru_cache(maxsize=1)
+def _cache_code_digest() -> str:
+    """Digest of the modules that shape parsed books (invalidates the cache on change)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module_path in PARSE_CODE_FILES:
+        digest.update(file_digest(module_path).encode())
+    return digest.hexdigest()
+
+
+def parse_book(usj_data: bytes) -> list[ParsedVerse]:
+    """Parse USJ file contents and precompute each verse's text, Strong's list and word counts."""
+    parsed: list[ParsedVerse] = []
+
+    for dv in parse_usj_bytes(usj_data):
+        words = dv["w"]
+
+        # One pass over the words collects both the text and the Strong's tags
+        texts: list[str] = []
+        tags: list[str] = []
+        for text, s in words:
+            texts.append(text)
+            if s:
+                tags.append(s)
+
+        verse: ParsedVerse = {
+            "b": dv["b"],
+            "c": dv["c"],
+            "v": dv["v"],
+            "t": "".join(texts).strip(),
+            "s": strongs_from_tags(tags),
+            "word_count": len(words),
+            "strongs_word_count": len(tags),
+        }
+        if dv.get("citations"):
+            verse["citations"] = dv["citations"]
+        parsed.append(verse)
+
+    return parsed
+
+
+def get_parsed_book(book_code: str, usj_path: Path) -> list[ParsedVerse]:
+    """Return a book's parsed verses, from the cache when its source is unchanged.
+
+    The USJ file is read once: the same bytes are hashed for the cache key
+    and, on a miss, parsed. A missing, truncated or corrupt entry is a miss;
+    the book's stale entries are dropped and the new one stored over any bad
+    file. Entries are written atomically, so builders running at the same
+    time can both fill the cache safely.
+    """
+    usj_data = usj_path.read_bytes()
+    usj_digest = hashlib.blake2b(usj_data, digest_size=16).hexdigest()
+    key = hashlib.blake2b(
+        f"{_cache_code_digest()}:{usj_digest}".encode(), digest_size=16
+    ).hexdigest()
+    cache_entry = PARSED_CACHE_DIR / f"{book_code}-{key}.pickle"
+
+    cached: list[ParsedVerse] | None = load_pickle(cache_entry)
+    if cached is not None:
+        return cached
+
+    parsed = parse_book(usj_data)
+
+    ensure_dir(PARSED_CACHE_DIR)
+    for stale in PARSED_CACHE_DIR.glob(f"{book_code}-*.pickle"):
+        if stale != cache_entry:
+            stale.unlink(missing_ok=True)
+    write_bytes_atomic(cache_entry, pickle.dumps(parsed))
+
+    return parsed
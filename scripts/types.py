@@ -156,6 +156,18 @@ class DisplayVerse(TypedDict, total=False):
     citations: list[str]  # Scripture citations from footnotes ["2CO 4:6", "HEB 11:3"]
 
 
+# Parsed verse with the per-verse values the index builders derive from its words
+class ParsedVerse(TypedDict, total=False):
+    b: str  # Book code
+    c: int  # Chapter number
+    v: int  # Verse number
+    t: str  # Plain text
+    s: list[str]  # Strong's numbers array
+    word_count: int  # Number of words
+    strongs_word_count: int  # Number of words with a Strong's number
+    citations: list[str]  # Scripture citations from footnotes
+
+
 # UBS Gloss entry (richer than basic Strong's definition)
 class UBSGlossEntry(TypedDict, total=False):
     lemma: str  # Hebrew/Greek word (e.g., "אָב", "ἀγάπη")
@@ -225,7 +237,7 @@ class StrongsEntry(TypedDict):
 
 
 # Statistics output
-@dataclass
+@dataclass(slots=True)
 class BuildStats:
     total_verses: int = 0
     total_words: int = 0
@@ -236,6 +248,17 @@ class BuildStats:
     books_processed: int = 0
     unique_strongs: set[str] = field(default_factory=set)
 
+    def __iadd__(self, other: "BuildStats") -> "BuildStats":
+        """Merge partial stats (e.g. from a per-book worker) into this one."""
+        self.total_verses += other.total_verses
+        self.total_words += other.total_words
+        self.words_with_strongs += other.words_with_strongs
+        self.total_cross_references += other.total_cross_references
+        self.total_topics += other.total_topics
+        self.books_processed += other.books_processed
+        self.unique_strongs |= other.unique_strongs
+        return self
+
     def to_dict(self) -> dict:
         return {
             "total_verses": self.total_verses,
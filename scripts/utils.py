@@ -1,9 +1,19 @@
 """Shared utility functions for BSB Data processing."""
 
-import json
+import hashlib
+import os
+import pickle
 import re
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import Any, TypeVar
+
+import orjson
 
 from .types import BOOK_CODES, BOOK_NUMBERS
 
@@ -28,53 +38,222 @@ INDEX_CC_BY_SPLIT_DIR = BASE_DIR / "index-cc-by"
 CONCORDANCE_DIR = BASE_DIR / "concordance"
 SCHEMA_DIR = OUTPUT_DIR / "schema"
 
+# Local build cache (not published)
+CACHE_DIR = PROJECT_ROOT / ".cache"
+ENRICH_CACHE_DIR = CACHE_DIR / "enrich"
+
 # Vector DB output directories (sibling to base/)
 VECTOR_DB_DIR = OUTPUT_DIR / "vector-db"
 INDEX_PD_DIR = VECTOR_DB_DIR / "index-pd"
 INDEX_CC_BY_DIR = VECTOR_DB_DIR / "index-cc-by"
 
+# Buffer size for large streamed writes (fewer write syscalls)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Threads for writing batches of small files (I/O bound)
+WRITE_THREADS = 8
+
+# Environment variable capping each stage's worker processes; build.py sets it so
+# stages running side by side share the CPUs instead of each starting one per CPU
+WORKERS_ENV = "BSB_WORKERS"
+
+# Strong's number parts for normalization: prefix, number, optional suffix ("h0430a")
+STRONGS_NORMALIZE_PATTERN = re.compile(r"^([HG])(\d+)([a-z]?)$", re.IGNORECASE)
+
+T = TypeVar("T")
+
+
+def worker_count() -> int:
+    """Return how many worker processes a stage's process pool may start."""
+    return int(os.environ.get(WORKERS_ENV, 0)) or os.cpu_count() or 1
+
 
 def ensure_dir(path: Path) -> None:
     """Ensure a directory exists, creating it if necessary."""
     path.mkdir(parents=True, exist_ok=True)
 
 
+def file_digest(path: Path) -> str:
+    """Return a BLAKE2b hex digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(WRITE_BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def read_json(path: Path) -> dict | list:
-    """Read a JSON file."""
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    """Read a JSON file (parsed from bytes by orjson, without a text decode pass)."""
+    data: dict | list = orjson.loads(path.read_bytes())
+    return data
+
+
+def load_pickle(path: Path) -> Any:
+    """Unpickle a cache entry, or return None if it is missing, unreadable or corrupt.
+
+    A truncated or damaged entry is a cache miss rather than an error, so the
+    caller rebuilds it and the next write replaces the bad file.
+    """
+    try:
+        return pickle.loads(path.read_bytes())
+    except (OSError, EOFError, AttributeError, ValueError, pickle.UnpicklingError):
+        return None
+
+
+def _temp_path(path: Path) -> Path:
+    """Return a sibling temp path unique to this process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> int:
+    """Write bytes to a file via a temp file and rename; returns the bytes written."""
+    tmp_path = _temp_path(path)
+    size = tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return size
+
+
+def file_has_bytes(path: Path, data: bytes) -> bool:
+    """Return True if the file exists and holds exactly these bytes."""
+    try:
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> int:
+    """Atomically write bytes unless the file already holds exactly these bytes.
+
+    Unchanged files keep their inode and mtime, so incremental syncs skip them.
+    Returns the file size.
+    """
+    if file_has_bytes(path, data):
+        return len(data)
+    return write_bytes_atomic(path, data)
+
+
+def write_files(files: list[tuple[Path, bytes]]) -> int:
+    """Write a batch of (path, bytes) files atomically, overlapping the writes.
+
+    Files whose contents are unchanged are left untouched.
+    Returns the total size of the files.
+    """
+    with ThreadPoolExecutor(max_workers=WRITE_THREADS) as pool:
+        return sum(pool.map(lambda file: write_bytes_if_changed(*file), files))
+
 
+def encode_json(data: dict | list, compact: bool = False) -> bytes:
+    """Encode data as JSON bytes (UTF-8, 2-space indent unless compact)."""
+    option = orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, option=option)
 
-def write_json(path: Path, data: dict | list, compact: bool = False) -> None:
-    """Write JSON to file."""
+
+def encode_jsonl(items: Iterable[Any]) -> bytes:
+    """Encode items as JSONL bytes, one compact object per line (for small files)."""
+    dumps = orjson.dumps
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    return b"".join([dumps(item, option=option) for item in items])
+
+
+def write_json(path: Path, data: dict | list, compact: bool = False) -> int:
+    """Write JSON to file (UTF-8, 2-space indent unless compact).
+
+    The file is replaced atomically, so concurrent builds never see a partial file.
+    Returns the number of bytes written.
+    """
     ensure_dir(path.parent)
-    with open(path, "w", encoding="utf-8") as f:
-        if compact:
-            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
-        else:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    return write_bytes_atomic(path, encode_json(data, compact))
 
 
-def write_jsonl(path: Path, items: list, compact: bool = True) -> None:
-    """Write JSONL (JSON Lines) to file."""
+def write_jsonl(path: Path, items: Iterable[Any]) -> int:
+    """Write JSONL (JSON Lines) to file, one compact object per line.
+
+    Accepts any iterable so callers can stream records without building a list.
+    The file is replaced atomically, so concurrent builds never see a partial file.
+    Returns the number of bytes written.
+    """
     ensure_dir(path.parent)
-    with open(path, "w", encoding="utf-8") as f:
+    tmp_path = _temp_path(path)
+    size = 0
+    dumps = orjson.dumps
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
         for item in items:
-            if compact:
-                f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n")
-            else:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            size += f.write(dumps(item, option=option))
+    os.replace(tmp_path, path)
+    return size
 
 
-def read_jsonl(path: Path) -> list:
-    """Read JSONL file."""
-    items = []
-    with open(path, encoding="utf-8") as f:
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    """Stream items from a JSONL file without loading it all into memory."""
+    with open(path, "rb", buffering=WRITE_BUFFER_SIZE) as f:
         for line in f:
             line = line.strip()
             if line:
-                items.append(json.loads(line))
-    return items
+                yield orjson.loads(line)
+
+
+def read_jsonl(path: Path) -> list:
+    """Read JSONL file."""
+    return list(iter_jsonl(path))
+
+
+def existing_files(*paths: Path) -> list[Path]:
+    """Return the given paths that exist, in order."""
+    return [path for path in paths if path.exists()]
+
+
+def disk_cached(
+    source_files: Callable[[], list[Path]],
+) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """Cache a source loader's result in .cache/enrich/ across builds.
+
+    The cache key digests the files returned by source_files together with
+    the loader's module, this one and types.py, so editing either the sources
+    or the code invalidates it. An unreadable or corrupt cache entry counts as
+    a miss. When none of the source files exist the loader runs uncached, so
+    its missing-source warnings are still logged.
+    """
+
+    def decorate(loader: Callable[[], T]) -> Callable[[], T]:
+        name = loader.__name__
+
+        @wraps(loader)
+        def cached_loader() -> T:
+            paths = source_files()
+            if not paths:
+                return loader()
+
+            digest = hashlib.blake2b(digest_size=16)
+            code_files = [
+                Path(str(sys.modules[loader.__module__].__file__)),
+                Path(__file__),
+                Path(__file__).with_name("types.py"),
+            ]
+            for path in code_files + paths:
+                digest.update(f"{path.name}:{file_digest(path)}\n".encode())
+            cache_entry = ENRICH_CACHE_DIR / f"{name}-{digest.hexdigest()}.pickle"
+
+            cached: T | None = load_pickle(cache_entry)
+            if cached is not None:
+                log(f"Loaded {name} result from cache")
+                return cached
+
+            result = loader()
+
+            ensure_dir(ENRICH_CACHE_DIR)
+            for stale in ENRICH_CACHE_DIR.glob(f"{name}-*.pickle"):
+                if stale != cache_entry:
+                    stale.unlink(missing_ok=True)
+            write_bytes_atomic(cache_entry, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+            return result
+
+        return cached_loader
+
+    return decorate
 
 
 def book_number_to_code(num: int) -> str:
@@ -93,8 +272,13 @@ def book_code_to_number(code: str) -> int:
     return num
 
 
+@lru_cache(maxsize=None)
 def verse_id(book: str, chapter: int, verse: int) -> str:
-    """Create verse ID from components."""
+    """Create verse ID from components.
+
+    Memoized: the enrichment loaders build the same ids once per word or
+    cross-reference, and repeated ids then share a single string object.
+    """
     return f"{book}.{chapter}.{verse}"
 
 
@@ -111,9 +295,13 @@ def is_valid_strongs(strongs: str) -> bool:
     return bool(re.match(r"^[HG]\d{1,4}[a-z]?$", strongs, re.IGNORECASE))
 
 
+@lru_cache(maxsize=None)
 def normalize_strongs(strongs: str) -> str:
-    """Normalize Strong's number (uppercase, remove leading zeros)."""
-    match = re.match(r"^([HG])(\d+)([a-z]?)$", strongs, re.IGNORECASE)
+    """Normalize Strong's number (uppercase, remove leading zeros).
+
+    Cached: called for every tagged word, but there are only ~15k distinct values.
+    """
+    match = STRONGS_NORMALIZE_PATTERN.match(strongs)
     if not match:
         return strongs
     prefix, num, suffix = match.groups()
@@ -122,15 +310,19 @@ def normalize_strongs(strongs: str) -> str:
 
 def extract_strongs_from_words(words: list[tuple[str, str | None]]) -> list[str]:
     """Extract all Strong's numbers from a verse's word pairs."""
-    strongs_list: list[str] = []
-    for _, s in words:
-        if s:
-            # Handle multiple strongs separated by /
-            for part in s.split("/"):
-                normalized = normalize_strongs(part.strip())
-                if is_valid_strongs(normalized) and normalized not in strongs_list:
-                    strongs_list.append(normalized)
-    return strongs_list
+    return strongs_from_tags(s for _, s in words if s)
+
+
+def strongs_from_tags(tags: Iterable[str]) -> list[str]:
+    """Normalize word Strong's tags into a unique list, in first-seen order."""
+    strongs: dict[str, None] = {}
+    for tag in tags:
+        # Handle multiple strongs separated by /
+        for part in tag.split("/"):
+            normalized = normalize_strongs(part.strip())
+            if normalized not in strongs and is_valid_strongs(normalized):
+                strongs[normalized] = None
+    return list(strongs)
 
 
 def words_to_plain_text(words: list[tuple[str, str | None]]) -> str:
@@ -0,0 +1 @@
+"""Tests for the BSB data build scripts (run with: python -m unittest discover)."""
@@ -0,0 +1,108 @@
+"""Tests for verse text extraction from plain USJ (scripts/build_text_only.py)."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from scripts.build_text_only import extract_verses_from_usj
+
+
+def chapter(number: int) -> dict[str, Any]:
+    return {"type": "chapter", "marker": "c", "number": str(number)}
+
+
+def verse(number: str) -> dict[str, Any]:
+    return {"type": "verse", "marker": "v", "number": number}
+
+
+def verse_end(ref: str) -> dict[str, Any]:
+    return {"type": "verse", "marker": "v", "eid": ref}
+
+
+def para(*content: Any) -> dict[str, Any]:
+    return {"type": "para", "marker": "p", "content": list(content)}
+
+
+def char(*content: Any) -> dict[str, Any]:
+    return {"type": "char", "marker": "add", "content": list(content)}
+
+
+class ExtractVersesFromUsjTest(unittest.TestCase):
+    def extract(self, *content: Any) -> dict[int, dict[int, str]]:
+        usj = {"type": "USJ", "version": "3.1", "content": list(content)}
+        with tempfile.TemporaryDirectory() as tmp:
+            usj_path = Path(tmp) / "GEN.usj"
+            usj_path.write_bytes(orjson.dumps(usj))
+            return extract_verses_from_usj(usj_path)
+
+    def test_verses_in_paragraphs(self) -> None:
+        verses = self.extract(
+            chapter(1),
+            para(verse("1"), "In the beginning God created the heavens and the earth. "),
+            para(verse("2"), " Now the earth was formless and void."),
+            chapter(2),
+            para(verse("1"), "Thus the heavens and the earth were completed."),
+        )
+        self.assertEqual(
+            verses,
+            {
+                1: {
+                    1: "In the beginning God created the heavens and the earth.",
+                    2: "Now the earth was formless and void.",
+                },
+                2: {1: "Thus the heavens and the earth were completed."},
+            },
+        )
+
+    def test_nested_strings_end_at_first_element(self) -> None:
+        # Only the strings right after the marker belong to the verse; text in
+        # and after a nested element does not
+        verses = self.extract(
+            chapter(1),
+            para(verse("1"), "And God said,", char("let there be"), " light."),
+        )
+        self.assertEqual(verses, {1: {1: "And God said,"}})
+
+    def test_nested_strings_replace_top_level_strings_concatenate(self) -> None:
+        verses = self.extract(
+            chapter(1),
+            para(verse("1"), "first ", "second"),
+            verse("2"),
+            "top ",
+            "level",
+        )
+        self.assertEqual(verses, {1: {1: "second", 2: "top level"}})
+
+    def test_verse_end_marker_closes_verse(self) -> None:
+        verses = self.extract(
+            chapter(1),
+            para(verse("1"), "Verse text.", verse_end("GEN 1:1"), "Not verse text."),
+        )
+        self.assertEqual(verses, {1: {1: "Verse text."}})
+
+    def test_verse_ranges_are_skipped(self) -> None:
+        verses = self.extract(
+            chapter(1),
+            para(verse("1-2"), "Bridged text."),
+            para(verse("3"), "Third verse."),
+        )
+        self.assertEqual(verses, {1: {3: "Third verse."}})
+
+    def test_repeated_verse_text_is_joined(self) -> None:
+        verses = self.extract(
+            chapter(1),
+            para(verse("4"), "First line "),
+            para(verse("4"), " second line"),
+        )
+        self.assertEqual(verses, {1: {4: "First line second line"}})
+
+    def test_verse_without_text_is_left_out(self) -> None:
+        verses = self.extract(chapter(1), para(verse("1"), "   "), para(verse("2")))
+        self.assertEqual(verses, {1: {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for the parsed USJ book cache (scripts/parse_cache.py)."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from scripts import parse_cache
+from scripts.utils import load_pickle
+
+USJ = {
+    "type": "USJ",
+    "version": "3.1",
+    "content": [
+        {"type": "book", "marker": "id", "code": "1JN"},
+        {"type": "chapter", "marker": "c", "number": "1"},
+        {
+            "type": "para",
+            "marker": "p",
+            "content": [
+                {"type": "verse", "marker": "v", "number": "1"},
+                "That which was from the beginning, ",
+                {"type": "char", "marker": "w", "strong": "G1510", "content": ["was"]},
+            ],
+        },
+    ],
+}
+
+
+class GetParsedBookTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name) / "parsed"
+        self.usj_path = Path(tmp.name) / "1JN.usj"
+        self.usj_path.write_bytes(orjson.dumps(USJ))
+
+        patcher = mock.patch.object(parse_cache, "PARSED_CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_book_is_served_from_cache(self) -> None:
+        parsed = parse_cache.get_parsed_book("1JN", self.usj_path)
+
+        with mock.patch.object(parse_cache, "parse_book") as parse_book:
+            self.assertEqual(parse_cache.get_parsed_book("1JN", self.usj_path), parsed)
+        parse_book.assert_not_called()
+
+    def test_truncated_entry_is_reparsed_and_replaced(self) -> None:
+        parsed = parse_cache.get_parsed_book("1JN", self.usj_path)
+        [cache_entry] = self.cache_dir.glob("1JN-*.pickle")
+        cache_entry.write_bytes(cache_entry.read_bytes()[:10])
+
+        with mock.patch.object(
+            parse_cache, "parse_book", wraps=parse_cache.parse_book
+        ) as parse_book:
+            self.assertEqual(parse_cache.get_parsed_book("1JN", self.usj_path), parsed)
+        parse_book.assert_called_once()
+
+        # The bad entry was overwritten with a loadable one
+        self.assertEqual(load_pickle(cache_entry), parsed)
+
+
+if __name__ == "__main__":
+    unittest.main()